@@ -0,0 +1 @@
+"""Advent of Code 2025: shared tooling around the per-day solutions."""
@@ -0,0 +1,148 @@
+"""Batch mode: solve many inputs of one day across a process pool.
+
+Inputs come from a directory (every regular file in it) or a manifest
+file listing one input path per line (relative paths are taken from the
+manifest's directory, blank lines and # comments are skipped). Paths are
+handed to workers in chunks so the day module is imported once per
+worker, not once per input, and each finished input becomes one record
+with its answers and per-phase timings. A failing input is recorded with
+its error instead of stopping the batch.
+"""
+import os
+import time
+
+from aoc import days
+
+
+def collect(source):
+    """Input paths of a directory or manifest file, in a stable order."""
+    if os.path.isdir(source):
+        return sorted(entry.path for entry in os.scandir(source) if entry.is_file())
+    base = os.path.dirname(os.path.abspath(source))
+    paths = []
+    with open(source) as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith('#'):
+                paths.append(os.path.join(base, line))
+    return paths
+
+
+def solve_input(day, path, part_numbers=None):
+    """Parse and solve one input file; return its record."""
+    record = {'day': day, 'input': path}
+    start = time.perf_counter()
+    try:
+        mod = days.load(day)
+        data = days.build(day, mod, days.parse_file(day, mod, path))
+        record['parse'] = time.perf_counter() - start
+        solvers = days.SOLVERS[day][1:]
+        for part in part_numbers or days.parts(day):
+            t = time.perf_counter()
+            record[f'part{part}'] = solvers[part - 1](mod, data)
+            record[f'part{part}_seconds'] = time.perf_counter() - t
+    except Exception as e:
+        record['error'] = f"{type(e).__name__}: {e}"
+    record['seconds'] = time.perf_counter() - start
+    return record
+
+
+def _solve_chunk(day, paths, part_numbers):
+    return [solve_input(day, path, part_numbers) for path in paths]
+
+
+def default_chunksize(count, jobs):
+    """About four chunks per worker, at most 64 inputs each."""
+    return max(1, min(64, count // (jobs * 4)))
+
+
+def run(day, paths, part_numbers=None, jobs=None, chunksize=None, emit=None):
+    """Solve every path and return (records, elapsed wall seconds).
+
+    emit(record) is called as soon as each input is done, so results can
+    be streamed out; with several workers they arrive in completion order.
+    """
+    start = time.perf_counter()
+    jobs = jobs or os.cpu_count() or 1
+    records = []
+
+    def done(chunk_records):
+        for record in chunk_records:
+            records.append(record)
+            if emit is not None:
+                emit(record)
+
+    if jobs == 1 or len(paths) <= 1:
+        for path in paths:
+            done([solve_input(day, path, part_numbers)])
+    else:
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+
+        size = chunksize or default_chunksize(len(paths), jobs)
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = [pool.submit(_solve_chunk, day, paths[i:i + size], part_numbers)
+                       for i in range(0, len(paths), size)]
+            for future in as_completed(futures):
+                done(future.result())
+    return records, time.perf_counter() - start
+
+
+def _percentile(ordered, q):
+    """Nearest-rank percentile of an already sorted list."""
+    if not ordered:
+        return 0.0
+    rank = max(1, -(-len(ordered) * q // 100))  # ceil(n * q / 100)
+    return ordered[rank - 1]
+
+
+def summary(records, elapsed):
+    """Throughput and per-input latency figures for a finished batch."""
+    latencies = sorted(r['seconds'] for r in records)
+    return {
+        'inputs': len(records),
+        'errors': sum('error' in r for r in records),
+        'elapsed': elapsed,
+        'inputs_per_second': len(records) / elapsed if elapsed else 0.0,
+        'p50': _percentile(latencies, 50),
+        'p90': _percentile(latencies, 90),
+        'p99': _percentile(latencies, 99),
+        'max': latencies[-1] if latencies else 0.0,
+    }
+
+
+def format_summary(stats):
+    return (f"{stats['inputs']} inputs ({stats['errors']} failed) in {stats['elapsed']:.3f}s: "
+            f"{stats['inputs_per_second']:.1f} inputs/s, latency "
+            f"p50 {stats['p50'] * 1000:.1f} ms, p90 {stats['p90'] * 1000:.1f} ms, "
+            f"p99 {stats['p99'] * 1000:.1f} ms, max {stats['max'] * 1000:.1f} ms")
+
+
+def test():
+    # Nearest rank: p50 of 1..10 is 5, p90 is 9, p99 rounds up to the max
+    ordered = [i / 10 for i in range(1, 11)]
+    assert [_percentile(ordered, q) for q in (50, 90, 99, 100)] == [0.5, 0.9, 1.0, 1.0]
+    assert _percentile([0.3], 1) == 0.3 and _percentile([], 50) == 0.0
+    records = [{'seconds': s} for s in ordered[::-1]] + [{'seconds': 0.0, 'error': 'x'}]
+    stats = summary(records, 2.2)
+    assert (stats['inputs'], stats['errors'], stats['max']) == (11, 1, 1.0)
+    assert (stats['p50'], stats['p90'], stats['inputs_per_second']) == (0.5, 0.9, 5.0)
+    assert summary([], 0)['inputs_per_second'] == 0.0
+    assert default_chunksize(1000, 4) == 62 and default_chunksize(3, 8) == 1
+
+    # A manifest resolves relative paths; a bad input is recorded, not raised
+    import tempfile
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, text in (('good.txt', "3-5\n10-14\n\n1\n5\n11\n"), ('bad.txt', "3-5\n10\n\n1\n")):
+            with open(os.path.join(tmp, name), 'w') as f:
+                f.write(text)
+        manifest = os.path.join(tmp, 'inputs.lst')
+        with open(manifest, 'w') as f:
+            f.write("# day 05\ngood.txt\n\nbad.txt\n")
+        paths = collect(manifest)
+        assert paths == [os.path.join(tmp, 'good.txt'), os.path.join(tmp, 'bad.txt')]
+        assert collect(tmp) == sorted(paths + [manifest])
+        records, _ = run("05", paths, jobs=1)
+        good, bad = records
+        assert (good['part1'], good['part2'], 'error' in good) == (2, 8, False)
+        assert bad['error'].startswith("ValueError: line 2:"), bad['error']
+    print("All tests passed!")
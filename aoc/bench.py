@@ -0,0 +1,144 @@
+"""Benchmark every day over a ladder of synthetic input sizes.
+
+Results are plain JSON so a run can be stored as a baseline and later
+runs compared against it: a part that got slower than the baseline by
+more than the tolerance, or that now gives a different answer, is a
+regression.
+"""
+import json
+import platform
+import time
+
+from aoc import days, generators
+
+
+def bench_day(day, scales=None, seed=0, repeat=1):
+    """Time each part of a day at every scale. Returns a list of records.
+
+    A part's time covers what solving it from the text costs: parsing,
+    the day's build step (see days.BUILDERS) and the solver, so a slower
+    parser shows up as a slower part. Only generating the input is left
+    out. A scale or part that raises gets a record with its error (and no
+    answer or time) instead of stopping the suite.
+    """
+    mod = days.load(day)
+    solvers = days.SOLVERS[day][1:]
+    records = []
+    for scale in scales or generators.LADDERS[day]:
+        text = error = None
+        try:
+            text = generators.generate(day, scale, seed)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        for part in days.parts(day):
+            record = {
+                'day': day,
+                'part': part,
+                'scale': scale,
+                'seed': seed,
+                'input_bytes': None if text is None else len(text),
+                'answer': None,
+                'seconds': None,
+            }
+            if error is None:
+                try:
+                    best = None
+                    for _ in range(repeat):
+                        start = time.perf_counter()
+                        answer = solvers[part - 1](mod, days.prepare(day, mod, text))
+                        elapsed = time.perf_counter() - start
+                        best = elapsed if best is None else min(best, elapsed)
+                    record.update(answer=str(answer), seconds=best)
+                except Exception as e:
+                    record['error'] = f"{type(e).__name__}: {e}"
+            else:
+                record['error'] = error
+            records.append(record)
+    return records
+
+
+def run(day_list, scales=None, seed=0, repeat=1, progress=None):
+    """Benchmark several days and return the JSON-ready report."""
+    results = []
+    for day in day_list:
+        for record in bench_day(day, scales, seed, repeat):
+            if progress:
+                progress(record)
+            results.append(record)
+    return {
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'results': results,
+    }
+
+
+def _key(record):
+    return record['day'], record['part'], record['scale'], record['seed']
+
+
+def compare(baseline, current, tolerance=0.25, min_seconds=0.01):
+    """Compare two reports and return a list of regression messages.
+
+    Timings below min_seconds in the baseline are too noisy to compare
+    and only have their answers checked.
+    """
+    base = {_key(r): r for r in baseline['results']}
+    problems = []
+    for record in current['results']:
+        old = base.get(_key(record))
+        if old is None:
+            continue
+        label = f"day {record['day']} part {record['part']} scale {record['scale']}"
+        if 'error' in record:
+            if 'error' not in old:
+                problems.append(f"{label}: failed ({record['error']})")
+            continue
+        if 'error' in old:
+            continue
+        if old['answer'] != record['answer']:
+            problems.append(f"{label}: answer changed {old['answer']} -> {record['answer']}")
+        if old['seconds'] >= min_seconds and record['seconds'] > old['seconds'] * (1 + tolerance):
+            problems.append(f"{label}: {old['seconds']:.3f}s -> {record['seconds']:.3f}s "
+                            f"(+{record['seconds'] / old['seconds'] - 1:.0%})")
+    return problems
+
+
+def load(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def save(report, path):
+    with open(path, 'w') as f:
+        json.dump(report, f, indent=2)
+        f.write('\n')
+
+
+def test():
+    def report(*records):
+        return {'results': [dict(zip(('day', 'part', 'scale', 'seed', 'answer', 'seconds'), r))
+                            for r in records]}
+
+    base = report(("01", 1, 1, 0, "3", 0.10), ("01", 2, 1, 0, "6", 0.10),
+                  ("02", 1, 1, 0, "9", 0.001), ("02", 2, 1, 0, "5", 0.10))
+    assert compare(base, base) == []
+    current = report(("01", 1, 1, 0, "3", 0.20), ("01", 2, 1, 0, "7", 0.11),
+                     ("02", 1, 1, 0, "9", 0.005), ("02", 2, 1, 0, None, None),
+                     ("03", 1, 1, 0, "1", 9.0))
+    current['results'][3]['error'] = "IndexError: boom"
+    problems = compare(base, current)
+    # Slower beyond the tolerance, a changed answer and a new failure; a
+    # sub-10 ms baseline and a measurement with no baseline are not flagged
+    assert len(problems) == 3, problems
+    assert problems[0].startswith("day 01 part 1 scale 1: 0.100s -> 0.200s")
+    assert problems[1] == "day 01 part 2 scale 1: answer changed 6 -> 7"
+    assert problems[2] == "day 02 part 2 scale 1: failed (IndexError: boom)"
+    assert compare(current, current) == []
+
+    # bench_day records a scale its generator rejects instead of raising
+    failed = bench_day("08", scales=[0.1])
+    assert [r['part'] for r in failed] == [1, 2]
+    assert all(r['error'].startswith("ValueError") and r['seconds'] is None for r in failed)
+    ok = bench_day("02", scales=[1], repeat=2)
+    assert all('error' not in r and r['seconds'] > 0 and r['answer'] for r in ok)
+    print("All tests passed!")
@@ -0,0 +1,198 @@
+"""Persistent cache of solver answers, keyed by what produced them.
+
+An entry is keyed by (day, part, solver version, input hash). The solver
+version is a hash of the day's source file and the aoc modules it
+depends on (the registry, the input parser, the grid...), so editing any
+of them makes the old answers unreachable; the input hash is a SHA-256
+of the input bytes.
+Entries live in one sqlite file and are evicted least recently used
+first once there are more than max_entries.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import time
+
+from aoc import days, inputs
+
+
+def default_path():
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'aoc-2025', 'results.sqlite')
+
+
+def _module_path(name):
+    path = os.path.join(days.ROOT, *name.split('.')) + '.py'
+    return path if os.path.isfile(path) else None
+
+
+def source_files(day):
+    """The day's source file plus every aoc module it depends on, sorted.
+
+    Starts from aoc/dayNN.py and aoc/days.py (the parse, build and part
+    wiring) and follows `import aoc.x` / `from aoc import x` / `from aoc.x
+    import ...` statements, including imports inside functions.
+    """
+    import ast
+
+    pending = [days.source_path(day), _module_path('aoc.days')]
+    seen = set()
+    while pending:
+        path = pending.pop()
+        if path is None or path in seen:
+            continue
+        seen.add(path)
+        with open(path, 'rb') as f:
+            tree = ast.parse(f.read(), path)
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+                names = [node.module] + [f"{node.module}.{alias.name}" for alias in node.names]
+            else:
+                continue
+            pending.extend(_module_path(name) for name in names
+                           if name == 'aoc' or name.startswith('aoc.'))
+    return sorted(seen)
+
+
+def solver_version(day):
+    """Short hash of the sources the day's answers depend on (see source_files)."""
+    digest = hashlib.sha256()
+    for path in source_files(day):
+        with open(path, 'rb') as f:
+            source = f.read()
+        name = os.path.relpath(path, days.ROOT).encode()
+        digest.update(b'%s\0%d\0' % (name, len(source)))
+        digest.update(source)
+    return digest.hexdigest()[:16]
+
+
+def input_digest(path):
+    """SHA-256 of a file's bytes, read through mmap."""
+    with inputs.mapped(path) as buf:
+        return hashlib.sha256(buf).hexdigest()
+
+
+class ResultCache:
+    def __init__(self, path=None, max_entries=10000):
+        self.path = path or default_path()
+        self.max_entries = max_entries
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self.db = sqlite3.connect(self.path, timeout=30)
+        self.db.execute("""
+            CREATE TABLE IF NOT EXISTS results (
+                day TEXT NOT NULL,
+                part INTEGER NOT NULL,
+                version TEXT NOT NULL,
+                input_hash TEXT NOT NULL,
+                answer TEXT NOT NULL,
+                seconds REAL NOT NULL,
+                last_used REAL NOT NULL,
+                PRIMARY KEY (day, part, version, input_hash)
+            )""")
+        self.db.execute("CREATE INDEX IF NOT EXISTS results_lru ON results (last_used)")
+        self.db.commit()
+
+    def get(self, day, part, version, input_hash):
+        """Return (answer, original seconds) or None, and mark the entry as used."""
+        key = (day, part, version, input_hash)
+        row = self.db.execute(
+            "SELECT answer, seconds FROM results"
+            " WHERE day = ? AND part = ? AND version = ? AND input_hash = ?", key).fetchone()
+        if row is None:
+            return None
+        self.db.execute(
+            "UPDATE results SET last_used = ?"
+            " WHERE day = ? AND part = ? AND version = ? AND input_hash = ?",
+            (time.time(),) + key)
+        self.db.commit()
+        return json.loads(row[0]), row[1]
+
+    def put(self, day, part, version, input_hash, answer, seconds):
+        self.db.execute(
+            "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (day, part, version, input_hash, json.dumps(answer), seconds, time.time()))
+        self.evict()
+        self.db.commit()
+
+    def evict(self):
+        """Drop least recently used entries beyond max_entries."""
+        self.db.execute(
+            "DELETE FROM results WHERE rowid IN ("
+            " SELECT rowid FROM results ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,))
+
+    def invalidate(self, day_list=None, part_numbers=None):
+        """Delete entries for the given days/parts (everything by default)."""
+        query = "DELETE FROM results WHERE 1"
+        params = []
+        if day_list:
+            query += f" AND day IN ({','.join('?' * len(day_list))})"
+            params += day_list
+        if part_numbers:
+            query += f" AND part IN ({','.join('?' * len(part_numbers))})"
+            params += part_numbers
+        deleted = self.db.execute(query, params).rowcount
+        self.db.commit()
+        return deleted
+
+    def stats(self):
+        """Entry count per day."""
+        return self.db.execute(
+            "SELECT day, COUNT(*), SUM(seconds) FROM results GROUP BY day ORDER BY day").fetchall()
+
+    def close(self):
+        self.db.close()
+
+
+def test():
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ResultCache(os.path.join(tmp, 'results.sqlite'), max_entries=2)
+        cache.put("01", 1, "v1", "h", 3, 0.5)
+        assert cache.get("01", 1, "v1", "h") == (3, 0.5)
+        # A changed solver version (or input) is a miss, not the old answer
+        assert cache.get("01", 1, "v2", "h") is None
+        assert cache.get("01", 1, "v1", "other") is None
+
+        # Least recently used goes first: reading 01/1 keeps it over 01/2
+        time.sleep(0.01)
+        cache.put("01", 2, "v1", "h", [1, 2], 0.25)
+        time.sleep(0.01)
+        assert cache.get("01", 1, "v1", "h") == (3, 0.5)
+        time.sleep(0.01)
+        cache.put("02", 1, "v1", "h", "x", 1.0)
+        assert cache.get("01", 2, "v1", "h") is None
+        assert cache.get("01", 1, "v1", "h") == (3, 0.5)
+        assert cache.stats() == [("01", 1, 0.5), ("02", 1, 1.0)]
+
+        cache.max_entries = 10
+        cache.put("01", 2, "v1", "h", [1, 2], 0.25)
+        assert cache.invalidate(["01"], [2]) == 1
+        assert cache.invalidate(["03"]) == 0
+        assert cache.invalidate([], [1]) == 2
+        assert cache.stats() == []
+        cache.close()
+
+        # The version covers the shared modules a day's answers depend on:
+        # editing the input parser in a copy of the package changes it
+        import shutil
+
+        files = {os.path.relpath(path, days.ROOT) for path in source_files("05")}
+        assert {os.path.join('aoc', name) for name in ('day05.py', 'days.py', 'inputs.py')} <= files
+        assert solver_version("05") == solver_version("05") != solver_version("06")
+        root = days.ROOT
+        shutil.copytree(os.path.join(root, 'aoc'), os.path.join(tmp, 'aoc'),
+                        ignore=shutil.ignore_patterns('__pycache__'))
+        try:
+            days.ROOT = tmp
+            before = solver_version("05")
+            with open(os.path.join(tmp, 'aoc', 'inputs.py'), 'a') as f:
+                f.write("\n")
+            assert solver_version("05") != before
+        finally:
+            days.ROOT = root
+    print("All tests passed!")
@@ -0,0 +1,358 @@
+"""Command line entry point: python -m aoc <command> ...
+
+argparse (and json) import re, which a plain `run` should not pay for,
+so the common `run` invocations are parsed by _fast_run_args() and only
+everything else goes through argparse.
+"""
+import sys
+
+from aoc import days
+
+
+def cmd_run(args):
+    from aoc import runner
+
+    day_list = days.parse_days(args.days or ['01..12'])
+    cache = None
+    if args.cache or args.cache_path:
+        from aoc.cache import ResultCache
+        cache = ResultCache(args.cache_path, max_entries=args.max_entries)
+    results, elapsed = runner.run(day_list, part_numbers=args.part, jobs=args.jobs,
+                                  split_parts=args.split_parts, cache=cache,
+                                  self_test=args.self_test)
+    print(runner.format_table(results, elapsed))
+
+
+def cmd_test(args):
+    for day in days.parse_days(args.days or ['01..12']):
+        print(f"Day {day}: ", end='', flush=True)
+        days.load(day).test()
+    if not args.days:
+        for name in ('inputs', 'cache', 'batch', 'generators', 'bench'):
+            print(f"{name.capitalize()}: ", end='', flush=True)
+            __import__(f"aoc.{name}")
+            sys.modules[f"aoc.{name}"].test()
+        print("CLI: ", end='', flush=True)
+        test()
+
+
+def cmd_startup(args):
+    from aoc import startup
+
+    failed = False
+    for day in days.parse_days(args.days or ['01..12']):
+        report, problems = startup.check(day, args.budget_ms)
+        print('\n'.join(report))
+        for problem in problems:
+            print(f"  OVER BUDGET: {problem}")
+        failed = failed or bool(problems)
+    if failed:
+        sys.exit(1)
+
+
+def cmd_cache(args):
+    from aoc.cache import ResultCache
+
+    cache = ResultCache(args.path, max_entries=args.max_entries)
+    if args.action == 'stats':
+        print(f"Cache: {cache.path}")
+        for day, count, seconds in cache.stats():
+            print(f"day {day}: {count} entries, {seconds:.3f}s of solving stored")
+    elif args.action == 'invalidate':
+        day_list = days.parse_days(args.days) if args.days else None
+        print(f"Removed {cache.invalidate(day_list, args.part)} entries")
+    else:
+        cache.evict()
+        cache.db.commit()
+    cache.close()
+
+
+def cmd_stream(args):
+    from aoc import streaming
+
+    day = days.parse_days([args.day])[0]
+
+    def report(count, totals):
+        print(f"[{count} lines] " + '  '.join(f"part{i}={t}" for i, t in enumerate(totals, 1)),
+              file=sys.stderr, flush=True)
+
+    lines = streaming.open_lines(args.input)
+    try:
+        count, totals = streaming.run(day, lines, every=args.every,
+                                      interval=args.interval, report=report)
+    finally:
+        if lines is not sys.stdin:
+            lines.close()
+    for total in totals:
+        print(total)
+
+
+def cmd_batch(args):
+    import json
+
+    from aoc import batch
+
+    day = days.parse_days([args.day])[0]
+    paths = batch.collect(args.source)
+    out = open(args.out, 'w') if args.out else sys.stdout
+
+    def emit(record):
+        out.write(json.dumps(record) + '\n')
+        out.flush()
+
+    try:
+        records, elapsed = batch.run(day, paths, part_numbers=args.part, jobs=args.jobs,
+                                     chunksize=args.chunksize, emit=emit)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    stats = batch.summary(records, elapsed)
+    print(batch.format_summary(stats), file=sys.stderr)
+    if stats['errors']:
+        sys.exit(1)
+
+
+def cmd_gen(args):
+    from aoc import generators
+
+    day = days.parse_days([args.day])[0]
+    sys.stdout.write(generators.generate(day, args.scale, args.seed))
+
+
+def cmd_bench(args):
+    import json
+
+    from aoc import bench
+
+    day_list = days.parse_days(args.days or ['01..12'])
+
+    def progress(r):
+        label = f"day {r['day']} part {r['part']} scale {r['scale']:>6}"
+        if 'error' in r:
+            print(f"{label}: FAILED {r['error']}", file=sys.stderr)
+        else:
+            print(f"{label}: {r['seconds']:.4f}s ({r['input_bytes']} bytes)", file=sys.stderr)
+
+    report = bench.run(day_list, scales=args.scales, seed=args.seed,
+                       repeat=args.repeat, progress=progress)
+    if args.out:
+        bench.save(report, args.out)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    if args.baseline:
+        problems = bench.compare(bench.load(args.baseline), report,
+                                 tolerance=args.tolerance)
+        for problem in problems:
+            print(f"REGRESSION {problem}", file=sys.stderr)
+        if problems:
+            sys.exit(1)
+    if any('error' in r for r in report['results']):
+        sys.exit(1)
+
+
+def cmd_profile(args):
+    from aoc import profiling
+
+    day = days.parse_days([args.day])[0]
+    text = path = None
+    if args.scale is not None:
+        from aoc import generators
+        text = generators.generate(day, args.scale, args.seed)
+    else:
+        path = args.input or days.input_path(day)
+
+    hook = None
+    if args.cprofile:
+        import cProfile
+        profiler = cProfile.Profile()
+        hook = lambda name, fn, arg: profiler.runcall(fn, arg)
+    elif args.collapsed:
+        collector = profiling.StackCollector(f"day{day}")
+        hook = collector.run
+
+    records = profiling.run_phases(day, text, path, part_numbers=args.part,
+                                   memory=args.memory, hook=hook)
+    print(profiling.format_phases(day, records))
+
+    if args.cprofile:
+        profiler.dump_stats(args.cprofile)
+        print(f"cProfile stats written to {args.cprofile}")
+    elif args.collapsed:
+        collector.write(args.collapsed)
+        print(f"Collapsed stacks written to {args.collapsed}")
+
+
+def _scales(value):
+    return [float(s) if '.' in s else int(s) for s in value.split(',')]
+
+
+def build_parser():
+    import argparse
+
+    parser = argparse.ArgumentParser(prog='python -m aoc',
+                                     description='Advent of Code 2025 tooling.')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    run = sub.add_parser('run', help='run days in parallel and print a timing table')
+    run.add_argument('days', nargs='*', help="days to run, e.g. 01..12 or 3,5 (default: all)")
+    run.add_argument('-p', '--part', type=int, action='append', choices=[1, 2],
+                     help='only run this part (repeatable)')
+    run.add_argument('-j', '--jobs', type=int, default=None,
+                     help='worker processes (default: CPU count, 1 runs in-process)')
+    run.add_argument('--split-parts', action='store_true',
+                     help='schedule each part as its own task')
+    run.add_argument('--cache', action='store_true',
+                     help='reuse cached answers for unchanged code and input')
+    run.add_argument('--cache-path', metavar='PATH',
+                     help='cache file, implies --cache (default: ~/.cache/aoc-2025/results.sqlite)')
+    run.add_argument('--max-entries', type=int, default=10000,
+                     help='LRU bound kept by the cache (default: 10000)')
+    run.add_argument('--self-test', action='store_true',
+                     help="run each day's example assertions before solving")
+    run.set_defaults(func=cmd_run)
+
+    test = sub.add_parser('test', help="run the days' example assertions")
+    test.add_argument('days', nargs='*', help='days to test (default: all)')
+    test.set_defaults(func=cmd_test)
+
+    startup = sub.add_parser('startup', help='check the import budget of `run DAY`')
+    startup.add_argument('days', nargs='*', help='days to check (default: all)')
+    startup.add_argument('--budget-ms', type=float, default=40,
+                         help='allowed import time for aoc and the day (default: 40)')
+    startup.set_defaults(func=cmd_startup)
+
+    cache = sub.add_parser('cache', help='inspect or invalidate the result cache')
+    cache.add_argument('action', choices=['stats', 'invalidate', 'evict'])
+    cache.add_argument('days', nargs='*', help='days to invalidate (default: all)')
+    cache.add_argument('-p', '--part', type=int, action='append', choices=[1, 2])
+    cache.add_argument('--path', help='cache file (default: ~/.cache/aoc-2025/results.sqlite)')
+    cache.add_argument('--max-entries', type=int, default=10000,
+                       help='LRU bound applied by evict (default: 10000)')
+    cache.set_defaults(func=cmd_cache)
+
+    stream = sub.add_parser('stream', help='solve a one-pass day from a line stream')
+    stream.add_argument('day', help='01, 03, 05 or 10')
+    stream.add_argument('input', nargs='?', default='-',
+                        help='input file, *.gz allowed (default: stdin)')
+    stream.add_argument('-n', '--every', type=int, default=1000000,
+                        help='report running totals every N lines (default: 1000000, 0 = off)')
+    stream.add_argument('--interval', type=float, default=10,
+                        help='also report every N seconds (default: 10, 0 = off)')
+    stream.set_defaults(func=cmd_stream)
+
+    batch = sub.add_parser('batch', help='solve a directory or manifest of inputs for one day')
+    batch.add_argument('day')
+    batch.add_argument('source', help='directory of inputs, or a file listing one path per line')
+    batch.add_argument('-p', '--part', type=int, action='append', choices=[1, 2],
+                       help='only run this part (repeatable)')
+    batch.add_argument('-j', '--jobs', type=int, default=None,
+                       help='worker processes (default: CPU count, 1 runs in-process)')
+    batch.add_argument('--chunksize', type=int, default=None,
+                       help='inputs per worker task (default: ~4 chunks per worker, max 64)')
+    batch.add_argument('-o', '--out', help='write JSONL records here instead of stdout')
+    batch.set_defaults(func=cmd_batch)
+
+    gen = sub.add_parser('gen', help='print a synthetic input for a day')
+    gen.add_argument('day')
+    gen.add_argument('-s', '--scale', type=float, default=1,
+                     help='size relative to the shipped input (default: 1)')
+    gen.add_argument('--seed', type=int, default=0)
+    gen.set_defaults(func=cmd_gen)
+
+    bench = sub.add_parser('bench', help='benchmark days over a ladder of input sizes')
+    bench.add_argument('days', nargs='*', help='days to benchmark (default: all)')
+    bench.add_argument('-s', '--scales', type=_scales,
+                       help="comma separated scales, e.g. 1,10,100 (default: per-day ladder)")
+    bench.add_argument('--seed', type=int, default=0)
+    bench.add_argument('-r', '--repeat', type=int, default=1,
+                       help='runs per measurement, the fastest is kept')
+    bench.add_argument('-o', '--out', help='write the JSON report here instead of stdout')
+    bench.add_argument('-b', '--baseline', help='JSON report to compare against')
+    bench.add_argument('-t', '--tolerance', type=float, default=0.25,
+                       help='allowed slowdown vs the baseline (default: 0.25)')
+    bench.set_defaults(func=cmd_bench)
+
+    profile = sub.add_parser('profile', help='time parse/build/solve phases of one day')
+    profile.add_argument('day')
+    profile.add_argument('-p', '--part', type=int, action='append', choices=[1, 2],
+                         help='only run this part (repeatable)')
+    source = profile.add_mutually_exclusive_group()
+    source.add_argument('-i', '--input', help='input file (default: the shipped input)')
+    source.add_argument('-s', '--scale', type=float, help='use a synthetic input of this scale')
+    profile.add_argument('--seed', type=int, default=0)
+    profile.add_argument('-m', '--memory', action='store_true',
+                         help='trace allocations and peak memory per phase with tracemalloc')
+    output = profile.add_mutually_exclusive_group()
+    output.add_argument('--cprofile', metavar='FILE', help='dump cProfile stats (pstats format)')
+    output.add_argument('--collapsed', metavar='FILE',
+                        help='write flamegraph-ready collapsed stacks')
+    profile.set_defaults(func=cmd_profile)
+
+    return parser
+
+
+def _fast_run_args(argv):
+    """Parse `run` arguments without argparse; None if anything is unusual."""
+    from types import SimpleNamespace
+
+    args = SimpleNamespace(func=cmd_run, days=[], part=None, jobs=None,
+                           split_parts=False, cache=False, cache_path=None,
+                           max_entries=10000, self_test=False)
+    tokens = iter(argv)
+    for token in tokens:
+        if token in ('-p', '--part', '-j', '--jobs'):
+            value = next(tokens, '')
+            if not value.isdigit():
+                return None
+            if token in ('-p', '--part'):
+                if value not in ('1', '2'):
+                    return None
+                args.part = (args.part or []) + [int(value)]
+            else:
+                args.jobs = int(value)
+        elif token == '--split-parts':
+            args.split_parts = True
+        elif token == '--self-test':
+            args.self_test = True
+        elif token == '--cache':
+            args.cache = True
+        elif token.startswith('-'):
+            return None
+        else:
+            args.days.append(token)
+    return args
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    args = _fast_run_args(argv[1:]) if argv[:1] == ['run'] else None
+    parser = None
+    if args is None:
+        parser = build_parser()
+        args = parser.parse_args(argv)
+    try:
+        args.func(args)
+    except days.DaySpecError as e:
+        # Bad day arguments are usage errors; solver errors propagate as is
+        (parser or build_parser()).error(str(e))
+
+
+def test():
+    fast = _fast_run_args(['05', '--cache', '-j', '1'])
+    assert (fast.days, fast.cache, fast.jobs) == (['05'], True, 1)
+    # --cache is a plain flag: a day after it is still a day
+    assert _fast_run_args(['--cache', '05']).days == ['05']
+    assert build_parser().parse_args(['run', '--cache', '05']).days == ['05']
+    assert _fast_run_args(['05', '--cache-path', '/tmp/c.sqlite']) is None
+    args = build_parser().parse_args(['run', '05', '--cache-path', '/tmp/c.sqlite'])
+    assert (args.days, args.cache, args.cache_path) == (['05'], False, '/tmp/c.sqlite')
+    assert (fast.cache_path, fast.max_entries) == (None, 10000)
+    for spec in (['13'], ['x'], ['1..y']):
+        try:
+            days.parse_days(spec)
+            assert False, f"{spec} should be rejected"
+        except days.DaySpecError:
+            pass
+    print("All tests passed!")
@@ -0,0 +1,435 @@
+from array import array
+
+
+def rotation_steps(rotations):
+    """Convert rotations to signed distances: L68 -> -68, R48 -> 48."""
+    return [-int(rotation[1:]) if rotation[0] == "L" else int(rotation[1:])
+            for rotation in rotations]
+
+
+def rotation_step(line):
+    """Signed distance of one rotation line; ValueError unless it is L or R and digits."""
+    direction, distance = line[:1], line[1:]
+    if direction not in ("L", "R") or not (distance.isascii() and distance.isdigit()):
+        raise ValueError(f"bad rotation: {line!r}")
+    return -int(distance) if direction == "L" else int(distance)
+
+
+def solve_part1(rotations):
+    """Count times dial ends on 0 after a rotation."""
+    return count_final_zeros(rotation_steps(rotations))
+
+
+def count_final_zeros(steps):
+    """Count times dial ends on 0, given signed distances (array or list)."""
+    position = 50
+    count = 0
+    for step in steps:
+        position = (position + step) % 100
+        if position == 0:
+            count += 1
+    return count
+
+
+def count_zeros_in_rotation(position, direction, distance):
+    """Count how many times dial lands on 0 during a single rotation."""
+    if direction == "L":
+        # Landing positions: P-1, P-2, ..., P-D (before mod)
+        # Count multiples of 100 in [P-D, P-1]
+        return ((position - 1) // 100) - ((position - distance - 1) // 100)
+    else:
+        # Landing positions: P+1, P+2, ..., P+D (before mod)
+        # Count multiples of 100 in [P+1, P+D]
+        return ((position + distance) // 100) - (position // 100)
+
+
+def solve_part2(rotations):
+    """Count times dial passes through or lands on 0 during any rotation."""
+    return count_passing_zeros(rotation_steps(rotations))
+
+
+def count_passing_zeros(steps):
+    """Count times dial passes through or lands on 0, given signed distances."""
+    position = 50
+    count = 0
+    for step in steps:
+        if step < 0:
+            count += count_zeros_in_rotation(position, "L", -step)
+        else:
+            count += count_zeros_in_rotation(position, "R", step)
+        position = (position + step) % 100
+    return count
+
+
+def dial_totals(steps, start=50, modulus=100, chunk=1 << 22):
+    """(part 1, part 2) from one pass over signed distances.
+
+    NumPy arrays go through the vectorized engine, other sequences through
+    a plain loop that updates both counts at once.
+    """
+    if hasattr(steps, 'dtype'):
+        return _dial_totals_numpy((steps[i:i + chunk] for i in range(0, len(steps), chunk)),
+                                  start, modulus)
+    position = start
+    final_zeros = passing_zeros = 0
+    for step in steps:
+        end = position + step
+        if step < 0:
+            passing_zeros += (position - 1) // modulus - (end - 1) // modulus
+        else:
+            passing_zeros += end // modulus - position // modulus
+        position = end % modulus
+        if position == 0:
+            final_zeros += 1
+    return final_zeros, passing_zeros
+
+
+def _dial_totals_numpy(chunks, start, modulus):
+    """Vectorized dial_totals over an iterable of int64 step arrays.
+
+    Within a chunk the dial is left unwrapped: ends = start + cumsum(steps).
+    Zero hits are the multiples of the modulus a rotation moves onto, which
+    is the floor-division difference of count_zeros_in_rotation and does
+    not care how many whole turns the unwrapped position has made.
+    """
+    import numpy as np
+
+    position = start
+    final_zeros = passing_zeros = 0
+    for steps in chunks:
+        if not len(steps):
+            continue
+        steps = np.asarray(steps, dtype=np.int64)
+        ends = np.cumsum(steps)
+        ends += position
+        begins = ends - steps
+        final_zeros += int(np.count_nonzero(ends % modulus == 0))
+        left = steps < 0
+        # R: multiples in [begin+1, end]; L: multiples in [end, begin-1]
+        hits = ends // modulus - begins // modulus
+        hits[left] = (begins[left] - 1) // modulus - (ends[left] - 1) // modulus
+        passing_zeros += int(hits.sum())
+        position = int(ends[-1]) % modulus
+    return final_zeros, passing_zeros
+
+
+def _signed_chunks(buf, chunk_bytes):
+    """Signed step arrays for consecutive newline-aligned pieces of buf."""
+    from aoc import inputs
+
+    pos = 0
+    while pos < len(buf):
+        end = buf.find(b'\n', pos + chunk_bytes)
+        end = len(buf) if end < 0 else end + 1
+        yield inputs.parse_signed(buf[pos:end], numpy=True)
+        pos = end
+
+
+def scan_file(path, start=50, modulus=100, chunk_bytes=1 << 26):
+    """dial_totals of a rotation log, mmapped and parsed chunk by chunk.
+
+    Memory stays proportional to chunk_bytes, so logs of 100M+ rotations
+    do not need their whole step array at once. Requires NumPy.
+    """
+    from aoc import inputs
+
+    with inputs.mapped(path) as buf:
+        return _dial_totals_numpy(_signed_chunks(buf, chunk_bytes), start, modulus)
+
+
+def sweep(steps, moduli=(100,)):
+    """Both parts for every start position of every dial size, in one pass.
+
+    Returns {modulus: [(part 1, part 2) for start in range(modulus)]}.
+
+    With unwrapped prefix sums x -> y per rotation, a start offset s only
+    shifts them: floor((s + x) / m) = floor(x / m) + [x % m >= m - s]. So
+    each rotation adds a fixed zero count for s = 0 plus +1/-1 at two
+    residues, and the answer for s is that total plus a suffix sum of the
+    residue histogram. Part 1 is a histogram of where rotations end.
+    """
+    if hasattr(steps, 'dtype'):
+        return _sweep_numpy(steps, moduli)
+    base = {m: 0 for m in moduli}
+    edges = {m: [0] * m for m in moduli}
+    landed = {m: [0] * m for m in moduli}
+    x = 0
+    for step in steps:
+        y = x + step
+        for m in moduli:
+            if step < 0:
+                base[m] += (x - 1) // m - (y - 1) // m
+                edges[m][(x - 1) % m] += 1
+                edges[m][(y - 1) % m] -= 1
+            else:
+                base[m] += y // m - x // m
+                edges[m][y % m] += 1
+                edges[m][x % m] -= 1
+            landed[m][y % m] += 1
+        x = y
+    return {m: _sweep_answers(m, base[m], edges[m], landed[m]) for m in moduli}
+
+
+def _sweep_numpy(steps, moduli):
+    import numpy as np
+
+    steps = np.asarray(steps, dtype=np.int64)
+    ends = np.cumsum(steps)
+    begins = ends - steps
+    left = steps < 0
+    # Right turns count multiples in (x, y], left turns in [y, x): shift by one
+    upper = np.where(left, begins - 1, ends)
+    lower = np.where(left, ends - 1, begins)
+    results = {}
+    for m in moduli:
+        base = int((upper // m - lower // m).sum())
+        edges = np.bincount(upper % m, minlength=m) - np.bincount(lower % m, minlength=m)
+        landed = np.bincount(ends % m, minlength=m)
+        results[m] = _sweep_answers(m, base, edges.tolist(), landed.tolist())
+    return results
+
+
+def _sweep_answers(m, base, edges, landed):
+    # suffix[t] = sum(edges[t:]); start s picks up the residues >= m - s
+    suffix = [0] * (m + 1)
+    for r in range(m - 1, -1, -1):
+        suffix[r] = suffix[r + 1] + edges[r]
+    return [(landed[-s % m], base + suffix[m - s]) for s in range(m)]
+
+
+class DialCounter:
+    """One-pass running totals for both parts, fed one rotation line at a time."""
+
+    def __init__(self):
+        self.position = 50
+        self.final_zeros = 0
+        self.passing_zeros = 0
+
+    def feed(self, line):
+        line = line.strip()
+        if not line:
+            return
+        step = rotation_step(line)
+        self.passing_zeros += count_zeros_in_rotation(self.position, line[0], abs(step))
+        self.position = (self.position + step) % 100
+        if self.position == 0:
+            self.final_zeros += 1
+
+    def totals(self):
+        return self.final_zeros, self.passing_zeros
+
+
+class DialIndex:
+    """Prefix index over a rotation log for O(1) range and position queries.
+
+    After k rotations, positions[k] is the dial position, passing[k] the
+    zero hits so far (count_zeros_in_rotation) and final[k] the rotations
+    that ended on 0. Rotation ranges are 0-based and half-open, like slices.
+    """
+
+    def __init__(self, steps=(), start=50):
+        self.positions = array('q', [start])
+        self.passing = array('q', [0])
+        self.final = array('q', [0])
+        self.extend(steps)
+
+    def __len__(self):
+        return len(self.positions) - 1
+
+    def append(self, step):
+        """Add one signed rotation."""
+        position = self.positions[-1]
+        if step < 0:
+            hits = count_zeros_in_rotation(position, "L", -step)
+        else:
+            hits = count_zeros_in_rotation(position, "R", step)
+        position = (position + step) % 100
+        self.positions.append(position)
+        self.passing.append(self.passing[-1] + hits)
+        self.final.append(self.final[-1] + (position == 0))
+
+    def feed(self, line):
+        """Add one rotation line such as 'L68' (blank lines are ignored)."""
+        line = line.strip()
+        if line:
+            self.append(rotation_step(line))
+
+    def extend(self, steps):
+        """Add signed rotations; NumPy arrays are indexed in vectorized passes."""
+        if hasattr(steps, 'dtype'):
+            self._extend_numpy(steps)
+        else:
+            for step in steps:
+                self.append(step)
+
+    def _extend_numpy(self, steps):
+        import numpy as np
+
+        if not len(steps):
+            return
+        steps = np.asarray(steps, dtype=np.int64)
+        ends = np.cumsum(steps) + self.positions[-1]
+        begins = ends - steps
+        hits = np.where(steps < 0, (begins - 1) // 100 - (ends - 1) // 100,
+                        ends // 100 - begins // 100)
+        positions = ends % 100
+        self.positions.frombytes(positions.tobytes())
+        self.passing.frombytes((np.cumsum(hits) + self.passing[-1]).tobytes())
+        self.final.frombytes((np.cumsum(positions == 0, dtype=np.int64)
+                              + self.final[-1]).tobytes())
+
+    def _check(self, start, stop):
+        if not 0 <= start <= stop <= len(self):
+            raise IndexError(f"rotation range [{start}, {stop}) outside [0, {len(self)}]")
+
+    def position(self, k):
+        """Dial position after the first k rotations (k = 0 is the start)."""
+        self._check(k, k)
+        return self.positions[k]
+
+    def zero_hits(self, start, stop):
+        """Times the dial passed or landed on 0 during rotations start..stop-1."""
+        self._check(start, stop)
+        return self.passing[stop] - self.passing[start]
+
+    def final_zeros(self, start, stop):
+        """Rotations among start..stop-1 that ended on 0."""
+        self._check(start, stop)
+        return self.final[stop] - self.final[start]
+
+    def totals(self):
+        return self.final[-1], self.passing[-1]
+
+
+def test():
+    # Example from problem
+    example = ['L68', 'L30', 'R48', 'L5', 'R60', 'L55', 'L1', 'L99', 'R14', 'L82']
+
+    # Part 1: should be 3 (lands on 0 after R48, L55, L99)
+    assert solve_part1(example) == 3, f"Part 1 example failed: got {solve_part1(example)}"
+
+    # Part 2: should be 6 (3 at end + 3 during rotations)
+    assert solve_part2(example) == 6, f"Part 2 example failed: got {solve_part2(example)}"
+
+    # Individual rotation tests from problem description:
+    # L68 from 50 -> 82: hits 0 once during rotation
+    assert count_zeros_in_rotation(50, 'L', 68) == 1, "L68 from 50 should hit 0 once"
+
+    # L30 from 82 -> 52: doesn't hit 0
+    assert count_zeros_in_rotation(82, 'L', 30) == 0, "L30 from 82 should not hit 0"
+
+    # R48 from 52 -> 0: hits 0 (lands on it)
+    assert count_zeros_in_rotation(52, 'R', 48) == 1, "R48 from 52 should hit 0 once"
+
+    # L5 from 0 -> 95: doesn't hit 0 (starts at 0, but no click lands on 0)
+    assert count_zeros_in_rotation(0, 'L', 5) == 0, "L5 from 0 should not hit 0"
+
+    # R60 from 95 -> 55: hits 0 once during rotation
+    assert count_zeros_in_rotation(95, 'R', 60) == 1, "R60 from 95 should hit 0 once"
+
+    # L55 from 55 -> 0: hits 0 (lands on it)
+    assert count_zeros_in_rotation(55, 'L', 55) == 1, "L55 from 55 should hit 0 once"
+
+    # L1 from 0 -> 99: doesn't hit 0
+    assert count_zeros_in_rotation(0, 'L', 1) == 0, "L1 from 0 should not hit 0"
+
+    # L99 from 99 -> 0: hits 0 (lands on it)
+    assert count_zeros_in_rotation(99, 'L', 99) == 1, "L99 from 99 should hit 0 once"
+
+    # R14 from 0 -> 14: doesn't hit 0
+    assert count_zeros_in_rotation(0, 'R', 14) == 0, "R14 from 0 should not hit 0"
+
+    # L82 from 14 -> 32: hits 0 once during rotation
+    assert count_zeros_in_rotation(14, 'L', 82) == 1, "L82 from 14 should hit 0 once"
+
+    # Special case from problem: R1000 from 50 should hit 0 ten times
+    assert count_zeros_in_rotation(50, 'R', 1000) == 10, f"R1000 from 50 should hit 0 ten times, got {count_zeros_in_rotation(50, 'R', 1000)}"
+
+    # Signed distances (as produced by the byte-level parser) work directly
+    steps = rotation_steps(example)
+    assert steps[:3] == [-68, -30, 48]
+    assert count_final_zeros(steps) == 3
+    assert count_passing_zeros(steps) == 6
+
+    # Streaming totals match the list-based solvers
+    counter = DialCounter()
+    for line in example:
+        counter.feed(line + "\n")
+    assert counter.totals() == (3, 6)
+    for bad in ("X5", "L", "L 5", "R-3"):
+        for fed in (DialCounter(), DialIndex()):
+            try:
+                fed.feed(bad)
+                assert False, f"{bad!r} should be rejected"
+            except ValueError:
+                pass
+
+    # One-pass totals agree with the per-part solvers, including long
+    # rotations, zero-length ones and rotations starting on 0
+    import random
+    rng = random.Random(1)
+    many = [rng.choice([-1, 1]) * rng.choice([0, 1, 50, 99, 100, 250, rng.randrange(1000)])
+            for _ in range(2000)]
+    expected = (count_final_zeros(many), count_passing_zeros(many))
+    assert dial_totals(steps) == (3, 6)
+    assert dial_totals(many) == expected
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+    if np is not None:
+        assert dial_totals(np.array(steps)) == (3, 6)
+        assert dial_totals(np.array(many), chunk=7) == expected
+        import tempfile
+        with tempfile.NamedTemporaryFile('w', suffix='.txt') as f:
+            f.write('\n'.join(('L' if s < 0 else 'R') + str(abs(s)) for s in many) + '\n')
+            f.flush()
+            assert scan_file(f.name, chunk_bytes=64) == expected
+
+    # Prefix index: range answers equal re-solving the slice
+    index = DialIndex(many)
+    assert len(index) == len(many) and index.totals() == expected
+    for a, b in [(0, 0), (0, 10), (123, 1456), (1999, 2000), (0, 2000)]:
+        position = index.position(a)
+        assert index.zero_hits(a, b) == sum(
+            count_zeros_in_rotation(p, "L" if s < 0 else "R", abs(s))
+            for p, s in zip(index.positions[a:b], many[a:b]))
+        assert index.final_zeros(a, b) == sum(p == 0 for p in index.positions[a + 1:b + 1])
+        for step in many[a:b]:
+            position = (position + step) % 100
+        assert index.position(b) == position
+    grown = DialIndex()
+    for line in example:
+        grown.feed(line)
+    assert grown.totals() == (3, 6) and grown.position(3) == 0
+    if np is not None:
+        halves = DialIndex(np.array(many[:700]))
+        halves.extend(many[700:1000])
+        halves.extend(np.array(many[1000:]))
+        assert halves.positions == index.positions and halves.passing == index.passing
+        assert halves.final == index.final
+
+    # Sweep over start offsets and dial sizes matches one simulation each
+    swept = sweep(many, moduli=(100, 7, 360))
+    assert swept[100][50] == expected
+    for m, answers in swept.items():
+        assert len(answers) == m
+        for s in (0, 1, m // 2, m - 1):
+            assert answers[s] == dial_totals(many, start=s, modulus=m), (m, s)
+    assert sweep(steps)[100][50] == (3, 6)
+    if np is not None:
+        assert sweep(np.array(many), moduli=(100, 7, 360)) == swept
+
+    print("All tests passed!")
+
+
+if __name__ == "__main__":
+    import sys
+    if "--test" in sys.argv[1:]:
+        test()
+
+    with open("01_input.txt") as f:
+        rotations = [line.strip() for line in f if line.strip()]
+
+    print(solve_part1(rotations))
+    print(solve_part2(rotations))
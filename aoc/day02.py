@@ -0,0 +1,362 @@
+import os
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+
+
+def is_invalid_part1(n):
+    """Check if n is made of a digit sequence repeated exactly twice."""
+    s = str(n)
+    if len(s) % 2 != 0:
+        return False
+    half = len(s) // 2
+    return s[:half] == s[half:]
+
+
+def is_invalid_part2(n):
+    """Check if n is made of a digit sequence repeated at least twice."""
+    s = str(n)
+    # Try all possible repeat lengths (1 to len/2)
+    for repeat_len in range(1, len(s) // 2 + 1):
+        if len(s) % repeat_len == 0:
+            pattern = s[:repeat_len]
+            repeats = len(s) // repeat_len
+            if repeats >= 2 and pattern * repeats == s:
+                return True
+    return False
+
+
+def find_invalid_in_range(start, end, is_invalid_func):
+    """Find all invalid IDs in range [start, end]."""
+    invalid = []
+    for n in range(start, end + 1):
+        if is_invalid_func(n):
+            invalid.append(n)
+    return invalid
+
+
+def solve(input_text, is_invalid_func):
+    """Sum all invalid IDs in the given ranges."""
+    bounds = []
+    for r in input_text.strip().split(','):
+        r = r.strip()
+        if not r:
+            continue
+        bounds.extend(map(int, r.split('-')))
+    return sum_invalid(bounds, is_invalid_func)
+
+
+def _pairs(bounds):
+    """(start, end) pairs of flat range bounds; an unpaired bound is a ValueError."""
+    if len(bounds) % 2:
+        raise ValueError(f"{len(bounds)} range bounds do not split into start-end pairs")
+    return zip(bounds[::2], bounds[1::2])
+
+
+def sum_invalid(bounds, is_invalid_func):
+    """Sum all invalid IDs given flat range bounds [start0, end0, start1, end1, ...]."""
+    total = 0
+    for start, end in _pairs(bounds):
+        for n in range(start, end + 1):
+            if is_invalid_func(n):
+                total += n
+    return total
+
+
+def _mobius(n):
+    """Moebius function of a small positive integer."""
+    result = 1
+    factor = 2
+    while factor * factor <= n:
+        if n % factor == 0:
+            n //= factor
+            if n % factor == 0:
+                return 0
+            result = -result
+        factor += 1
+    return -result if n > 1 else result
+
+
+def _periods(length, at_least_twice):
+    """(period, weight) pairs that count every invalid ID of this length once.
+
+    Part 1 only has the half-length period. For part 2 the IDs repeating
+    with period d form sets whose intersections are again such sets (for
+    gcd(d, e)), so inclusion-exclusion over the proper divisors d of
+    length gives the weight -mobius(length / d).
+    """
+    if not at_least_twice:
+        return [(length // 2, 1)] if length % 2 == 0 else []
+    return [(d, -_mobius(length // d)) for d in range(1, length)
+            if length % d == 0 and _mobius(length // d)]
+
+
+def _repeat_multiplier(length, period):
+    """10^length-1 / 10^period-1: pattern * this repeats the pattern to length digits."""
+    return (10 ** length - 1) // (10 ** period - 1)
+
+
+def _repeat_count_sum(start, end, length, period):
+    """(count, sum) of length-digit IDs in [start, end] built from a period-digit pattern."""
+    multiplier = _repeat_multiplier(length, period)
+    low = max(10 ** (period - 1), -(-start // multiplier))
+    high = min(10 ** period - 1, end // multiplier)
+    if low > high:
+        return 0, 0
+    n = high - low + 1
+    return n, multiplier * (low + high) * n // 2
+
+
+def count_and_sum_invalid(start, end, at_least_twice=False):
+    """(count, sum) of invalid IDs in [start, end] without visiting the range.
+
+    Work depends on the number of digit lengths and divisors, not on
+    end - start. at_least_twice selects the part 2 rule.
+    """
+    count = total = 0
+    for length in range(len(str(max(start, 1))), len(str(end)) + 1):
+        for period, weight in _periods(length, at_least_twice):
+            n, s = _repeat_count_sum(start, end, length, period)
+            count += weight * n
+            total += weight * s
+    return count, total
+
+
+def sum_invalid_closed_form(bounds, at_least_twice=False):
+    """sum_invalid() for the part 1 (or part 2) rule, one closed form per range."""
+    return sum(count_and_sum_invalid(start, end, at_least_twice)[1]
+               for start, end in _pairs(bounds))
+
+
+def generate_invalid(start, end, at_least_twice=False):
+    """Sorted invalid IDs in [start, end], generated from their patterns."""
+    for length in range(len(str(max(start, 1))), len(str(end)) + 1):
+        found = set()
+        for period, _ in _periods(length, at_least_twice):
+            multiplier = _repeat_multiplier(length, period)
+            low = max(10 ** (period - 1), -(-start // multiplier))
+            high = min(10 ** period - 1, end // multiplier)
+            found.update(p * multiplier for p in range(low, high + 1))
+        yield from sorted(found)
+
+
+class InvalidIndex:
+    """Sorted invalid IDs up to a bound with prefix sums, for fast range queries.
+
+    ids and prefix (prefix[i] = sum(ids[:i])) are array('q'), so a query
+    is two bisects. Part 2 sums stay within int64 up to a bound of 10^12.
+    """
+
+    _VERSION = 1
+
+    def __init__(self, ids, bound, at_least_twice=False, prefix=None):
+        self.ids = ids
+        self.bound = bound
+        self.at_least_twice = at_least_twice
+        if prefix is None:
+            prefix = array('q', [0])
+            prefix.extend(accumulate(ids))
+        self.prefix = prefix
+
+    @classmethod
+    def build(cls, bound=10 ** 12, at_least_twice=False):
+        return cls(array('q', generate_invalid(1, bound, at_least_twice)), bound, at_least_twice)
+
+    def _span(self, start, end):
+        if end > self.bound:
+            raise ValueError(f"Range end {end} is beyond the index bound {self.bound}")
+        return bisect_left(self.ids, start), bisect_right(self.ids, end)
+
+    def count(self, start, end):
+        """Number of invalid IDs in [start, end]."""
+        i, j = self._span(start, end)
+        return max(0, j - i)
+
+    def sum(self, start, end):
+        """Sum of invalid IDs in [start, end]."""
+        i, j = self._span(start, end)
+        return self.prefix[j] - self.prefix[i] if j > i else 0
+
+    def list(self, start, end):
+        """Invalid IDs in [start, end], in order."""
+        i, j = self._span(start, end)
+        return self.ids[i:j].tolist()
+
+    def sum_ranges(self, bounds):
+        """sum_invalid() over flat range bounds, answered from the index."""
+        return sum(self.sum(start, end) for start, end in _pairs(bounds))
+
+    def range_sums(self, starts, ends):
+        """Per-range sums for NumPy arrays of starts and ends, in one vectorized batch."""
+        import numpy as np
+
+        if len(ends) and int(np.max(ends)) > self.bound:
+            raise ValueError(f"Range end {int(np.max(ends))} is beyond the index bound {self.bound}")
+        ids = np.frombuffer(self.ids, dtype=np.int64)
+        prefix = np.frombuffer(self.prefix, dtype=np.int64)
+        i = np.searchsorted(ids, starts, 'left')
+        j = np.maximum(np.searchsorted(ids, ends, 'right'), i)
+        return prefix[j] - prefix[i]
+
+    def save(self, path):
+        """Write the index (header, ids, prefix sums) as raw native int64."""
+        with open(path, 'wb') as f:
+            array('q', [self._VERSION, self.bound, self.at_least_twice, len(self.ids)]).tofile(f)
+            self.ids.tofile(f)
+            self.prefix.tofile(f)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            header = array('q')
+            header.fromfile(f, 4)
+            version, bound, at_least_twice, n = header
+            if version != cls._VERSION:
+                raise ValueError(f"{path}: unsupported index version {version}")
+            ids, prefix = array('q'), array('q')
+            ids.fromfile(f, n)
+            prefix.fromfile(f, n + 1)
+        return cls(ids, bound, bool(at_least_twice), prefix)
+
+    @classmethod
+    def load_or_build(cls, path, bound=10 ** 12, at_least_twice=False):
+        """Load the index at path if it covers this rule and bound, else build and save it."""
+        if os.path.exists(path):
+            index = cls.load(path)
+            if index.at_least_twice == at_least_twice and index.bound >= bound:
+                return index
+        index = cls.build(bound, at_least_twice)
+        index.save(path)
+        return index
+
+
+def test():
+    # Part 1: Test is_invalid_part1
+    assert is_invalid_part1(55) == True, "55 should be invalid"
+    assert is_invalid_part1(99) == True, "99 should be invalid"
+    assert is_invalid_part1(6464) == True, "6464 should be invalid"
+    assert is_invalid_part1(123123) == True, "123123 should be invalid"
+    assert is_invalid_part1(1010) == True, "1010 should be invalid"
+    assert is_invalid_part1(222222) == True, "222222 should be invalid"
+    assert is_invalid_part1(446446) == True, "446446 should be invalid"
+    assert is_invalid_part1(1188511885) == True, "1188511885 should be invalid"
+    assert is_invalid_part1(38593859) == True, "38593859 should be invalid"
+
+    assert is_invalid_part1(101) == False, "101 should be valid (odd length)"
+    assert is_invalid_part1(12) == False, "12 should be valid"
+    assert is_invalid_part1(1234) == False, "1234 should be valid"
+
+    # Part 1: Test ranges from example
+    assert find_invalid_in_range(11, 22, is_invalid_part1) == [11, 22], "11-22 should have 11, 22"
+    assert find_invalid_in_range(95, 115, is_invalid_part1) == [99], "95-115 should have 99"
+    assert find_invalid_in_range(998, 1012, is_invalid_part1) == [1010], "998-1012 should have 1010"
+    assert find_invalid_in_range(1188511880, 1188511890, is_invalid_part1) == [1188511885]
+    assert find_invalid_in_range(222220, 222224, is_invalid_part1) == [222222]
+    assert find_invalid_in_range(1698522, 1698528, is_invalid_part1) == []
+    assert find_invalid_in_range(446443, 446449, is_invalid_part1) == [446446]
+    assert find_invalid_in_range(38593856, 38593862, is_invalid_part1) == [38593859]
+
+    # Part 1: Test full example
+    example = """11-22,95-115,998-1012,1188511880-1188511890,222220-222224,
+1698522-1698528,446443-446449,38593856-38593862,565653-565659,
+824824821-824824827,2121212118-2121212124"""
+    assert solve(example, is_invalid_part1) == 1227775554, f"Part 1 example failed: {solve(example, is_invalid_part1)}"
+
+    # Part 2: Test is_invalid_part2 with new examples
+    assert is_invalid_part2(12341234) == True, "12341234 should be invalid (1234 x2)"
+    assert is_invalid_part2(123123123) == True, "123123123 should be invalid (123 x3)"
+    assert is_invalid_part2(1212121212) == True, "1212121212 should be invalid (12 x5)"
+    assert is_invalid_part2(1111111) == True, "1111111 should be invalid (1 x7)"
+    assert is_invalid_part2(111) == True, "111 should be invalid (1 x3)"
+    assert is_invalid_part2(999) == True, "999 should be invalid (1 x3)"
+    assert is_invalid_part2(565656) == True, "565656 should be invalid (56 x3)"
+    assert is_invalid_part2(824824824) == True, "824824824 should be invalid (824 x3)"
+    assert is_invalid_part2(2121212121) == True, "2121212121 should be invalid (21 x5)"
+
+    # Part 2: All part 1 invalids should still be invalid
+    assert is_invalid_part2(55) == True
+    assert is_invalid_part2(99) == True
+    assert is_invalid_part2(6464) == True
+    assert is_invalid_part2(1010) == True
+
+    # Part 2: Test ranges from example
+    assert find_invalid_in_range(11, 22, is_invalid_part2) == [11, 22], "11-22 should have 11, 22"
+    assert find_invalid_in_range(95, 115, is_invalid_part2) == [99, 111], "95-115 should have 99, 111"
+    assert find_invalid_in_range(998, 1012, is_invalid_part2) == [999, 1010], "998-1012 should have 999, 1010"
+    assert find_invalid_in_range(1188511880, 1188511890, is_invalid_part2) == [1188511885]
+    assert find_invalid_in_range(222220, 222224, is_invalid_part2) == [222222]
+    assert find_invalid_in_range(1698522, 1698528, is_invalid_part2) == []
+    assert find_invalid_in_range(446443, 446449, is_invalid_part2) == [446446]
+    assert find_invalid_in_range(38593856, 38593862, is_invalid_part2) == [38593859]
+    assert find_invalid_in_range(565653, 565659, is_invalid_part2) == [565656], "565653-565659 should have 565656"
+    assert find_invalid_in_range(824824821, 824824827, is_invalid_part2) == [824824824], "824824821-824824827 should have 824824824"
+    assert find_invalid_in_range(2121212118, 2121212124, is_invalid_part2) == [2121212121], "2121212118-2121212124 should have 2121212121"
+
+    # Part 2: Test full example
+    assert solve(example, is_invalid_part2) == 4174379265, f"Part 2 example failed: {solve(example, is_invalid_part2)}"
+
+    # Flat bounds arrays (as produced by the byte-level parser)
+    assert sum_invalid([11, 22, 95, 115], is_invalid_part1) == 11 + 22 + 99
+    assert sum_invalid([95, 115], is_invalid_part2) == 99 + 111
+
+    # Closed form and generator agree with scanning, including ranges
+    # that cross digit lengths and IDs with several periods (111111)
+    bounds = [int(b) for r in example.replace('\n', '').split(',') for b in r.split('-')]
+    assert sum_invalid_closed_form(bounds) == 1227775554
+    assert sum_invalid_closed_form(bounds, at_least_twice=True) == 4174379265
+    try:
+        sum_invalid_closed_form([11, 22, 95])
+        assert False, "an unpaired bound should be rejected"
+    except ValueError:
+        pass
+    for start, end in [(1, 1), (1, 10 ** 4), (95, 115), (99000, 102000), (111110, 111112)]:
+        for func, twice in [(is_invalid_part1, False), (is_invalid_part2, True)]:
+            expected = find_invalid_in_range(start, end, func)
+            assert list(generate_invalid(start, end, twice)) == expected, (start, end, twice)
+            assert count_and_sum_invalid(start, end, twice) == (len(expected), sum(expected))
+    assert count_and_sum_invalid(1, 10 ** 12 - 1)[0] == 999999
+    assert count_and_sum_invalid(1, 10 ** 5 - 1, True)[0] == len(
+        [n for n in range(1, 10 ** 5) if is_invalid_part2(n)])
+
+    # Prefix-sum index: count/sum/list by bisect, persisted round trip
+    import tempfile
+    for func, twice in [(is_invalid_part1, False), (is_invalid_part2, True)]:
+        index = InvalidIndex.build(10 ** 6, twice)
+        for start, end in [(11, 22), (95, 115), (1, 1), (500, 400), (99000, 102000), (1, 10 ** 6)]:
+            expected = find_invalid_in_range(start, end, func) if end - start < 10 ** 5 else \
+                list(generate_invalid(start, end, twice))
+            assert index.list(start, end) == expected
+            assert index.count(start, end) == len(expected)
+            assert index.sum(start, end) == sum(expected)
+        assert index.sum_ranges([11, 22, 95, 115]) == (11 + 22 + 99 + (111 if twice else 0))
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'index.bin')
+            InvalidIndex.load_or_build(path, 10 ** 6, twice)
+            loaded = InvalidIndex.load_or_build(path, 10 ** 5, twice)
+            assert (loaded.ids, loaded.prefix, loaded.bound) == (index.ids, index.prefix, 10 ** 6)
+    try:
+        index.sum(1, 10 ** 7)
+        assert False, "query beyond the bound should fail"
+    except ValueError:
+        pass
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+    if np is not None:
+        sums = index.range_sums(np.array([11, 95, 500]), np.array([22, 115, 400]))
+        assert sums.tolist() == [33, 210, 0]
+
+    print("All tests passed!")
+
+
+if __name__ == "__main__":
+    import sys
+    if "--test" in sys.argv[1:]:
+        test()
+
+    with open("02_input.txt") as f:
+        input_text = f.read()
+
+    print(solve(input_text, is_invalid_part1))
+    print(solve(input_text, is_invalid_part2))
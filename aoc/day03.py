@@ -0,0 +1,320 @@
+def max_joltage(bank, num_digits=2):
+    """Find the maximum num_digits-digit joltage from a bank.
+
+    Monotonic stack: a digit pops every smaller digit before it while
+    there are still digits to spare, which is the greedy "largest digit
+    that leaves enough remaining" choice in a single O(n) pass.
+    """
+    if num_digits > len(bank):
+        raise ValueError(f"Bank of {len(bank)} digits has no {num_digits}-digit joltage")
+    spare = len(bank) - num_digits
+    stack = []
+    for digit in bank:
+        while spare and stack and stack[-1] < digit:
+            stack.pop()
+            spare -= 1
+        stack.append(digit)
+    return int(''.join(stack[:num_digits]))
+
+
+def solve(lines, num_digits=2):
+    """Sum of max joltage from each bank."""
+    total = 0
+    for line in lines:
+        line = line.strip()
+        if line:
+            total += max_joltage(line, num_digits)
+    return total
+
+
+def max_joltage_batch(banks, num_digits=2):
+    """max_joltage of many equal-length banks at once, as an int64 NumPy array.
+
+    banks is a 2D array of digit values (one bank per row) or a list of
+    equal-length digit strings. Each output digit is one vectorized
+    argmax over the rows' remaining windows, so the cost is linear in the
+    number of banks. num_digits is limited to 18 by int64.
+    """
+    import numpy as np
+
+    if num_digits > 18:
+        raise ValueError("max_joltage_batch supports at most 18 digits")
+    if not hasattr(banks, 'ndim'):
+        raw = ''.join(banks).encode()
+        banks = np.frombuffer(raw, dtype=np.uint8).reshape(len(banks), -1) - 48
+    digits = banks.astype(np.int8)
+    rows, n = digits.shape
+    if num_digits > n:
+        raise ValueError(f"Bank of {n} digits has no {num_digits}-digit joltage")
+    columns = np.arange(n)
+    row_index = np.arange(rows)
+    start = np.zeros(rows, dtype=np.intp)
+    result = np.zeros(rows, dtype=np.int64)
+    for i in range(num_digits):
+        end = n - num_digits + i + 1
+        window = np.where(columns[:end] >= start[:, None], digits[:, :end], np.int8(-1))
+        best = window.argmax(axis=1)  # first maximum, like the greedy scan
+        result = result * 10 + digits[row_index, best]
+        start = best + 1
+    return result
+
+
+def solve_batch(lines, num_digits=2, chunk=1 << 16):
+    """solve() through max_joltage_batch, grouping banks by length in chunks."""
+    by_length = {}
+    for line in lines:
+        line = line.strip()
+        if line:
+            by_length.setdefault(len(line), []).append(line)
+    total = 0
+    for banks in by_length.values():
+        for i in range(0, len(banks), chunk):
+            total += int(max_joltage_batch(banks[i:i + chunk], num_digits).sum())
+    return total
+
+
+class JoltageTable:
+    """Digit drop order of one bank, computed once and shared by every k.
+
+    Dropping one digit at a time, always the first digit smaller than its
+    successor (else the last digit), leaves the best number at every
+    length, and max_joltage's stack pops digits in exactly that order. So
+    one stack pass with no limit records, for each drop, the digit's index
+    in the bank as it is at that moment (the top of the stack, or the end
+    once the scan is done). The k-digit answer is then the bank with the
+    first len(bank) - k drops applied, each a C-level bytearray delete.
+    """
+
+    def __init__(self, bank):
+        self.bank = bank.encode() if isinstance(bank, str) else bytes(bank)
+        self.drops = []
+        stack = []
+        for digit in self.bank:
+            while stack and stack[-1] < digit:
+                stack.pop()
+                self.drops.append(len(stack))
+            stack.append(digit)
+        self.drops.extend(range(len(stack) - 1, -1, -1))
+
+    def max_joltage(self, num_digits):
+        return self.joltages([num_digits])[num_digits]
+
+    def joltages(self, digit_counts=None):
+        """{k: max joltage} for the given k values (default: 1..len(bank))."""
+        n = len(self.bank)
+        digit_counts = list(range(1, n + 1) if digit_counts is None else digit_counts)
+        wanted = set(digit_counts)
+        for k in wanted:
+            if not 0 < k <= n:
+                raise ValueError(f"Bank of {n} digits has no {k}-digit joltage")
+        found = {}
+        digits = bytearray(self.bank)
+        if n in wanted:
+            found[n] = int(digits)
+        low = min(wanted, default=n)
+        for dropped, index in enumerate(self.drops[:n - low], 1):
+            del digits[index]
+            if n - dropped in wanted:
+                found[n - dropped] = int(digits)
+        return {k: found[k] for k in digit_counts}
+
+
+def solve_many(lines, digit_counts):
+    """{k: solve(lines, k)} for several k, preprocessing each bank once."""
+    digit_counts = list(digit_counts)
+    totals = dict.fromkeys(digit_counts, 0)
+    for line in lines:
+        line = line.strip()
+        if line:
+            for k, value in JoltageTable(line).joltages(digit_counts).items():
+                totals[k] += value
+    return totals
+
+
+_NON_DIGITS = bytes(b for b in range(256) if not 48 <= b <= 57)
+# digit byte -> the digit bytes above it
+_GREATER = {d: [c for c in range(d + 1, 58)] for d in range(48, 58)}
+
+
+def _push_free(stack, digits, num_digits):
+    """Stack step for digits that have at least num_digits more after them.
+
+    Popping is then always allowed, and the stack is capped at num_digits:
+    anything past the cap is no larger than what is kept and would be
+    popped before any kept digit.
+    """
+    i, n = 0, len(digits)
+    while i < n:
+        if len(stack) == num_digits:
+            # A full stack only changes at a digit above its last one
+            found = [j for j in (digits.find(c, i) for c in _GREATER[stack[-1]]) if j >= 0]
+            if not found:
+                return
+            i = min(found)
+        digit = digits[i]
+        while stack and stack[-1] < digit:
+            stack.pop()
+        if len(stack) < num_digits:
+            stack.append(digit)
+        i += 1
+
+
+def max_joltage_stream(stream, num_digits=2, as_str=False, chunk_size=1 << 20):
+    """max_joltage of one bank read from a binary stream in chunks.
+
+    stream is a binary file object, a path, or '-' for stdin; bytes other
+    than digits (newlines) are skipped. Only the last num_digits digits
+    are held back, since the spare-digit limit can only bite there, so
+    working memory is O(num_digits) plus one chunk. Pass as_str=True for
+    very large num_digits (int() refuses more than 4300 digits by default).
+    """
+    if isinstance(stream, str):
+        if stream == '-':
+            import sys
+            return max_joltage_stream(sys.stdin.buffer, num_digits, as_str, chunk_size)
+        with open(stream, 'rb') as f:
+            return max_joltage_stream(f, num_digits, as_str, chunk_size)
+    stack = []
+    held = b''
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        pending = held + chunk.translate(None, _NON_DIGITS)
+        cut = max(0, len(pending) - num_digits)
+        _push_free(stack, pending[:cut], num_digits)
+        held = pending[cut:]
+    # The last digits: pop only while the rest can still fill num_digits
+    for i, digit in enumerate(held):
+        remaining = len(held) - i
+        while stack and stack[-1] < digit and len(stack) - 1 + remaining >= num_digits:
+            stack.pop()
+        if len(stack) < num_digits:
+            stack.append(digit)
+    if len(stack) < num_digits:
+        raise ValueError(f"Bank has fewer than {num_digits} digits")
+    result = bytes(stack)
+    return result.decode() if as_str else int(result)
+
+
+class JoltageTotals:
+    """Running sums of max joltage for several digit counts, one bank per line."""
+
+    def __init__(self, digit_counts=(2, 12)):
+        self.digit_counts = digit_counts
+        self.sums = [0] * len(digit_counts)
+
+    def feed(self, line):
+        line = line.strip()
+        if not line:
+            return
+        # Solve every count before adding any, so a bad bank leaves no partial sums
+        values = [max_joltage(line, num_digits) for num_digits in self.digit_counts]
+        for i, value in enumerate(values):
+            self.sums[i] += value
+
+    def totals(self):
+        return tuple(self.sums)
+
+
+def test():
+    # Part 1: Test individual banks from example
+    assert max_joltage("987654321111111") == 98, f"Expected 98, got {max_joltage('987654321111111')}"
+    assert max_joltage("811111111111119") == 89, f"Expected 89, got {max_joltage('811111111111119')}"
+    assert max_joltage("234234234234278") == 78, f"Expected 78, got {max_joltage('234234234234278')}"
+    assert max_joltage("818181911112111") == 92, f"Expected 92, got {max_joltage('818181911112111')}"
+
+    # Part 1: Test full example
+    example = [
+        "987654321111111",
+        "811111111111119",
+        "234234234234278",
+        "818181911112111"
+    ]
+    assert solve(example) == 357, f"Expected 357, got {solve(example)}"
+
+    # Part 2: Test individual banks from example (12 digits)
+    assert max_joltage("987654321111111", 12) == 987654321111, f"Expected 987654321111, got {max_joltage('987654321111111', 12)}"
+    assert max_joltage("811111111111119", 12) == 811111111119, f"Expected 811111111119, got {max_joltage('811111111111119', 12)}"
+    assert max_joltage("234234234234278", 12) == 434234234278, f"Expected 434234234278, got {max_joltage('234234234234278', 12)}"
+    assert max_joltage("818181911112111", 12) == 888911112111, f"Expected 888911112111, got {max_joltage('818181911112111', 12)}"
+
+    # Part 2: Test full example
+    assert solve(example, 12) == 3121910778619, f"Expected 3121910778619, got {solve(example, 12)}"
+
+    # Streaming totals
+    totals = JoltageTotals()
+    for line in example:
+        totals.feed(line)
+    assert totals.totals() == (357, 3121910778619)
+
+    # Stack selection matches the windowed greedy scan on random banks
+    import random
+    rng = random.Random(3)
+
+    def greedy(bank, k):
+        result, start = '', 0
+        for i in range(k):
+            window = bank[start:len(bank) - k + i + 1]
+            best = window.index(max(window))
+            result += window[best]
+            start += best + 1
+        return int(result)
+
+    banks = [''.join(rng.choice('0123456789' if n % 3 else '9912') for _ in range(30))
+             for n in range(200)]
+    for bank in banks:
+        for k in (1, 2, 12, 30):
+            assert max_joltage(bank, k) == greedy(bank, k), (bank, k)
+    try:
+        max_joltage("12", 3)
+        assert False, "too few digits should fail"
+    except ValueError:
+        pass
+
+    # One drop order answers every k
+    for bank in banks[:50] + example:
+        table = JoltageTable(bank)
+        assert table.joltages() == {k: max_joltage(bank, k) for k in range(1, len(bank) + 1)}
+    assert JoltageTable("7").joltages() == {1: 7}
+    assert JoltageTable("12345").joltages(k for k in [1, 2]) == {1: 5, 2: 45}
+    assert solve_many(example, iter([2, 12])) == {2: 357, 12: 3121910778619}
+
+    # Chunked streams with line breaks give the same answers
+    import io
+    long_bank = ''.join(banks[:40])
+    for bank in banks[:20] + example + [long_bank]:
+        wrapped = '\n'.join(bank[i:i + 13] for i in range(0, len(bank), 13)).encode()
+        for k in (1, 2, 12, len(bank)):
+            for size in (1, 5, 64):
+                assert max_joltage_stream(io.BytesIO(wrapped), k, chunk_size=size) == \
+                    max_joltage(bank, k), (bank, k, size)
+    assert max_joltage_stream(io.BytesIO(b"0012\n"), 3, as_str=True) == "012"
+    try:
+        max_joltage_stream(io.BytesIO(b"12"), 3)
+        assert False, "too few digits should fail"
+    except ValueError:
+        pass
+
+    try:
+        import numpy
+    except ImportError:
+        numpy = None
+    if numpy is not None:
+        for k in (1, 2, 12, 18):
+            assert max_joltage_batch(banks, k).tolist() == [max_joltage(b, k) for b in banks]
+        assert solve_batch(example + banks, 12, chunk=7) == solve(example + banks, 12)
+
+    print("All tests passed!")
+
+
+if __name__ == "__main__":
+    import sys
+    if "--test" in sys.argv[1:]:
+        test()
+
+    with open("03_input.txt") as f:
+        lines = f.readlines()
+
+    print(solve(lines))
+    print(solve(lines, 12))
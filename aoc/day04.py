@@ -0,0 +1,455 @@
+import os
+from array import array
+from contextlib import contextmanager
+
+from aoc import inputs
+from aoc.grid import Grid
+
+ROLL = ord('@')
+EMPTY = ord('.')
+
+# Grids of at least this many cells use NumPy when it is installed
+_NUMPY_MIN_CELLS = 1 << 20
+
+
+def parse_grid(text):
+    """Parse the input into a padded Grid."""
+    return Grid.from_lines([line for line in text.splitlines() if line.strip()])
+
+
+def _as_grid(grid):
+    return grid if isinstance(grid, Grid) else Grid.from_lines(grid)
+
+
+def _use_numpy(numpy, grid):
+    if numpy is None:
+        if len(grid.data) < _NUMPY_MIN_CELLS:
+            return False
+        try:
+            import numpy
+        except ImportError:
+            return False
+        return True
+    return numpy
+
+
+def neighbor_counts(grid):
+    """8-neighbour roll counts of every cell, as a (rows, cols) uint8 NumPy array.
+
+    Sums eight shifted views of the padded roll mask, so there is no
+    per-cell Python work and no bounds checking.
+    """
+    import numpy as np
+
+    grid = _as_grid(grid)
+    rolls = (grid.array() == ROLL).view(np.uint8)
+    counts = np.zeros((grid.rows, grid.cols), dtype=np.uint8)
+    for dr in (-1, 0, 1):
+        for dc in (-1, 0, 1):
+            if dr or dc:
+                counts += grid.shifted(dr, dc, rolls)
+    return counts
+
+
+def _accessible_mask(grid):
+    return (grid.shifted() == ROLL) & (neighbor_counts(grid) < 4)
+
+
+def accessible_indices(grid):
+    """Flat indices of rolls that have fewer than 4 adjacent rolls."""
+    data = grid.data
+    offsets = grid.neighbor_offsets()
+    # The padding border is never a roll, so no bounds checks are needed
+    return [i for i in grid.indices(ROLL)
+            if [data[i + o] for o in offsets].count(ROLL) < 4]
+
+
+def get_accessible(grid, numpy=None):
+    """Get list of positions that have fewer than 4 adjacent rolls."""
+    grid = _as_grid(grid)
+    if _use_numpy(numpy, grid):
+        import numpy as np
+        return [tuple(rc) for rc in np.argwhere(_accessible_mask(grid)).tolist()]
+    return [grid.position(i) for i in accessible_indices(grid)]
+
+
+def count_accessible(grid, numpy=None):
+    """Count rolls that have fewer than 4 adjacent rolls (8-directional).
+
+    numpy=None picks the vectorized engine for large grids when NumPy is
+    installed; True/False forces either path.
+    """
+    grid = _as_grid(grid)
+    if _use_numpy(numpy, grid):
+        import numpy as np
+        return int(np.count_nonzero(_accessible_mask(grid)))
+    return len(accessible_indices(grid))
+
+
+def count_total_removable(grid):
+    """Count total rolls that can be removed by iteratively removing accessible ones."""
+    return sum(peel(grid, rounds=False)[0])
+
+
+_REMOVED = 255  # peel() marks removed rolls in counts (a live count is at most 8)
+
+
+def peel(grid, numpy=None, rounds=True):
+    """Remove accessible rolls wave by wave with a worklist.
+
+    Neighbour counts are computed once; removing a roll decrements its
+    neighbours and a roll joins the next wave when its count drops to 3,
+    so each roll and each of its neighbours is touched O(1) times in
+    total instead of once per round. Returns (rolls removed per wave,
+    rounds), where rounds is an array('I') laid out like grid.data:
+    rounds[grid.index(r, c)] is the 1-based wave that removed the roll at
+    (r, c), or 0 if it stays. The grid itself is not modified.
+
+    Removed rolls are marked in the one-byte-per-cell counts. With
+    rounds=False the 4-byte-per-cell rounds array is not built at all and
+    None is returned in its place, which matters on 10k x 10k grids.
+    """
+    grid = _as_grid(grid)
+    data = grid.data
+    offsets = grid.neighbor_offsets()
+    if _use_numpy(numpy, grid):
+        counts, wave = _initial_counts_numpy(grid)
+    else:
+        counts = bytearray(len(data))
+        wave = []
+        for i in grid.iter_indices(ROLL):
+            counts[i] = count = [data[i + o] for o in offsets].count(ROLL)
+            if count < 4:
+                wave.append(i)
+
+    marks = array('I', bytes(4 * len(data))) if rounds else None
+    waves = []
+    while wave:
+        number = len(waves) + 1
+        # Mark the whole wave first: rolls removed together do not feed
+        # each other into the next wave
+        for i in wave:
+            counts[i] = _REMOVED
+        if marks is not None:
+            for i in wave:
+                marks[i] = number
+        next_wave = []
+        for i in wave:
+            for o in offsets:
+                j = i + o
+                if data[j] == ROLL and counts[j] != _REMOVED:
+                    counts[j] -= 1
+                    if counts[j] == 3:
+                        next_wave.append(j)
+        waves.append(len(wave))
+        wave = next_wave
+    return waves, marks
+
+
+def _initial_counts_numpy(grid):
+    """peel()'s starting counts (as a bytearray laid out like grid.data) and first wave."""
+    import numpy as np
+
+    padded = np.zeros((grid.height, grid.stride), dtype=np.uint8)
+    grid.shifted(0, 0, padded)[...] = neighbor_counts(grid)
+    wave = np.flatnonzero((grid.array() == ROLL) & (padded < 4))
+    return bytearray(padded.tobytes()), wave.tolist()
+
+
+def count_neighbors(grid, r, c):
+    """Count adjacent @ neighbors for a cell."""
+    grid = _as_grid(grid)
+    i = grid.index(r, c)
+    return [grid.data[i + o] for o in grid.neighbor_offsets()].count(ROLL)
+
+
+def grid_shape(buf):
+    """(rows, cols, line length) of an equal-width grid file buffer."""
+    line_len = buf.find(b'\n') + 1
+    if not line_len:  # a single row without a newline
+        return (1, len(buf), len(buf) + 1) if len(buf) else (0, 0, 1)
+    rows = (len(buf) + 1) // line_len
+    if len(buf) not in (rows * line_len, rows * line_len - 1):
+        raise ValueError("Tiled mode needs every grid row to have the same width")
+    return rows, line_len - 1, line_len
+
+
+def _read_rows(buf, line_len, start, stop):
+    """Rows start..stop-1 of a grid file buffer, as bytes."""
+    return buf[start * line_len:stop * line_len].split(b'\n')[:stop - start]
+
+
+def _band_accessible(grid, first, count, numpy):
+    """Flat indices of accessible rolls in rows first..first+count-1 of a band grid."""
+    if _use_numpy(numpy, grid):
+        import numpy as np
+        rows, cols = np.nonzero(_accessible_mask(grid)[first:first + count])
+        return ((rows + first + grid.pad) * grid.stride + cols + grid.pad).tolist()
+    lo, hi = grid.index(first, -grid.pad), grid.index(first + count, -grid.pad)
+    return [i for i in accessible_indices(grid) if lo <= i < hi]
+
+
+def _count_band(path, start, stop, numpy):
+    with inputs.mapped(path) as buf:
+        rows, _, line_len = grid_shape(buf)
+        lo, hi = max(start - 1, 0), min(stop + 1, rows)
+        grid = Grid.from_lines(_read_rows(buf, line_len, lo, hi))
+    return len(_band_accessible(grid, start - lo, stop - start, numpy))
+
+
+def _peel_band(path, start, stop, top, bottom, numpy):
+    """One removal round on rows start..stop-1 of the working file, written in place.
+
+    top and bottom are the neighbouring bands' edge rows as they were at
+    the start of the round (None at the grid's edges). Returns (removed,
+    first row, last row) of the updated band.
+    """
+    with inputs.mapped(path) as buf:
+        line_len = grid_shape(buf)[2]
+        band = _read_rows(buf, line_len, start, stop)
+    first = 0 if top is None else 1
+    grid = Grid.from_lines(([] if top is None else [top]) + band +
+                           ([] if bottom is None else [bottom]))
+    removed = _band_accessible(grid, first, stop - start, numpy)
+    if removed:
+        for i in removed:
+            grid.data[i] = EMPTY
+        band = [grid.row(first + r).tobytes() for r in range(stop - start)]
+        with open(path, 'r+b') as f:
+            f.seek(start * line_len)
+            f.write(b'\n'.join(band))
+    return len(removed), band[0], band[-1]
+
+
+@contextmanager
+def _band_runner(jobs, tasks):
+    """Yield run(fn, args_list) -> results, in-process or over a process pool."""
+    if jobs == 1 or tasks <= 1:
+        yield lambda fn, arg_list: [fn(*args) for args in arg_list]
+        return
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        yield lambda fn, arg_list: list(pool.map(fn, *zip(*arg_list)))
+
+
+def _bands(rows, band_rows):
+    return [(start, min(start + band_rows, rows)) for start in range(0, rows, band_rows)]
+
+
+def count_accessible_tiled(path, band_rows=4096, jobs=None, numpy=None):
+    """count_accessible() of a grid file, in bands of rows with one-row halos.
+
+    The file is mmapped and each band is loaded on its own (in a process
+    pool unless jobs=1), so memory is bounded by band_rows x width per
+    worker. Rows must all have the same width.
+    """
+    with inputs.mapped(path) as buf:
+        rows = grid_shape(buf)[0]
+    bands = _bands(rows, band_rows)
+    with _band_runner(jobs, len(bands)) as run:
+        return sum(run(_count_band, [(path, start, stop, numpy) for start, stop in bands]))
+
+
+def count_total_removable_tiled(path, band_rows=4096, jobs=None, numpy=None, workdir=None):
+    """count_total_removable() of a grid file in bands; returns (total, removals per round).
+
+    Works on a copy of the file in workdir (default: the system temp dir).
+    Every round, each band reads its rows from the copy, takes its halo
+    rows from the previous round's band edges, and writes its removals
+    back in place. Bands only write their own rows, so a round sees the
+    grid exactly as it was when the round started. Only bands that changed,
+    or border one that did, are run again.
+    """
+    import shutil
+    import tempfile
+
+    waves = []
+    with tempfile.TemporaryDirectory(dir=workdir) as tmp:
+        work = os.path.join(tmp, 'grid')
+        shutil.copyfile(path, work)
+        with inputs.mapped(work) as buf:
+            rows, _, line_len = grid_shape(buf)
+            bands = _bands(rows, band_rows)
+            edges = [(_read_rows(buf, line_len, start, start + 1)[0],
+                      _read_rows(buf, line_len, stop - 1, stop)[0]) for start, stop in bands]
+        active = range(len(bands))
+        with _band_runner(jobs, len(bands)) as run:
+            while active:
+                results = run(_peel_band, [
+                    (work, *bands[b], edges[b - 1][1] if b else None,
+                     edges[b + 1][0] if b + 1 < len(bands) else None, numpy)
+                    for b in active])
+                changed = set()
+                for b, (removed, first, last) in zip(active, results):
+                    if removed:
+                        changed.add(b)
+                        edges[b] = first, last
+                if not changed:
+                    break
+                waves.append(sum(removed for removed, _, _ in results))
+                active = sorted({n for b in changed for n in (b - 1, b, b + 1)
+                                 if 0 <= n < len(bands)})
+    return sum(waves), waves
+
+
+def test():
+    example = [
+        "..@@.@@@@.",
+        "@@@.@.@.@@",
+        "@@@@@.@.@@",
+        "@.@@@@..@.",
+        "@@.@@@@.@@",
+        ".@@@@@@@.@",
+        ".@.@.@.@@@",
+        "@.@@@.@@@@",
+        ".@@@@@@@@.",
+        "@.@.@@@.@."
+    ]
+
+    # Test full example
+    result = count_accessible(example)
+    assert result == 13, f"Expected 13, got {result}"
+
+    # Expected accessible positions (from problem's x markers):
+    # ..xx.xx@x.  -> (0,2), (0,3), (0,5), (0,6), (0,8)
+    # x@@.@.@.@@  -> (1,0)
+    # @@@@@.x.@@  -> (2,6)
+    # @.@@@@..@.  -> none
+    # x@.@@@@.@x  -> (4,0), (4,9)
+    # .@@@@@@@.@  -> none
+    # .@.@.@.@@@  -> none
+    # x.@@@.@@@@  -> (7,0)
+    # .@@@@@@@@.  -> none
+    # x.x.@@@.x.  -> (9,0), (9,2), (9,8)
+    expected_accessible = [
+        (0, 2), (0, 3), (0, 5), (0, 6), (0, 8),
+        (1, 0),
+        (2, 6),
+        (4, 0), (4, 9),
+        (7, 0),
+        (9, 0), (9, 2), (9, 8)
+    ]
+
+    # Verify each expected accessible cell has < 4 neighbors
+    for r, c in expected_accessible:
+        assert example[r][c] == '@', f"({r},{c}) should be @"
+        neighbors = count_neighbors(example, r, c)
+        assert neighbors < 4, f"({r},{c}) has {neighbors} neighbors, expected < 4"
+
+    # Test a non-accessible cell (should have >= 4 neighbors)
+    # Pick (1,1) which is @ surrounded by many @s
+    assert example[1][1] == '@'
+    neighbors = count_neighbors(example, 1, 1)
+    assert neighbors >= 4, f"(1,1) has {neighbors} neighbors, expected >= 4"
+
+    # Test edge case: single roll with no neighbors
+    single = ["@"]
+    assert count_accessible(single) == 1, "Single @ should be accessible"
+
+    # Test edge case: roll with exactly 4 neighbors (not accessible)
+    cross = [
+        ".@.",
+        "@@@",
+        ".@."
+    ]
+    assert count_accessible(cross) == 4, f"Cross pattern: corners accessible, center has 4 neighbors"
+
+    # Part 2: Test total removable
+    # From the example: 13 + 12 + 7 + 5 + 2 + 1 + 1 + 1 + 1 = 43
+    total = count_total_removable(example)
+    assert total == 43, f"Expected 43 total removable, got {total}"
+
+    # Test that cross pattern can be fully removed (center becomes accessible after corners removed)
+    assert count_total_removable(cross) == 5, "Cross pattern should be fully removable"
+
+    # Worklist peeling reports the waves and each roll's removal round
+    waves, rounds = peel(example)
+    assert waves == [13, 12, 7, 5, 2, 1, 1, 1, 1]
+    grid = Grid.from_lines(example)
+    assert all(rounds[grid.index(r, c)] == 1 for r, c in expected_accessible)
+    assert rounds[grid.index(0, 0)] == 0  # empty cell
+    assert peel(cross)[0] == [4, 1]
+    assert peel(["..."])[0] == []
+
+    # ...and matches removing whole rounds with get_accessible
+    import random
+    rng = random.Random(4)
+    for _ in range(20):
+        rows = ["".join(rng.choice("@@@.") for _ in range(17)) for _ in range(13)]
+        grid = Grid.from_lines(rows)
+        expected_waves = []
+        while True:
+            accessible = accessible_indices(grid)
+            if not accessible:
+                break
+            for i in accessible:
+                grid.data[i] = EMPTY
+            expected_waves.append(len(accessible))
+        assert peel(rows)[0] == expected_waves
+        assert peel(rows, rounds=False) == (expected_waves, None)
+
+    # Vectorized neighbour counts agree with the scalar path
+    try:
+        import numpy
+    except ImportError:
+        numpy = None
+    if numpy is not None:
+        counts = neighbor_counts(example)
+        assert all(counts[r, c] == count_neighbors(example, r, c)
+                   for r in range(10) for c in range(10))
+        assert count_accessible(example, numpy=True) == 13
+        assert get_accessible(example, numpy=True) == expected_accessible
+        assert count_accessible(cross, numpy=True) == 4
+        assert count_accessible(single, numpy=True) == 1
+        for _ in range(10):
+            rows = ["".join(rng.choice("@@@.") for _ in range(23)) for _ in range(9)]
+            assert count_accessible(rows, numpy=True) == count_accessible(rows, numpy=False)
+            fast, slow = peel(rows, numpy=True), peel(rows, numpy=False)
+            assert fast[0] == slow[0] and fast[1] == slow[1]
+            assert peel(rows, numpy=True, rounds=False)[0] == slow[0]
+
+    # Tiled mode over a file: bands, halos and rounds match the in-memory answers
+    import tempfile
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "grid.txt")
+        with open(path, "w") as f:
+            f.write("\n".join(example))  # no trailing newline
+        for band_rows in (1, 3, 10, 64):
+            assert count_accessible_tiled(path, band_rows, jobs=1) == 13
+            assert count_total_removable_tiled(path, band_rows, jobs=1) == \
+                (43, [13, 12, 7, 5, 2, 1, 1, 1, 1])
+        assert count_accessible_tiled(path, 4, jobs=2) == 13
+        assert count_total_removable_tiled(path, 4, jobs=2)[0] == 43
+        with open(path) as f:
+            assert f.read() == "\n".join(example)  # the input is left untouched
+        rows = ["".join(rng.choice("@@@.") for _ in range(31)) for _ in range(29)]
+        with open(path, "w") as f:
+            f.write("\n".join(rows) + "\n")
+        waves = peel(rows)[0]
+        for numpy_flag in ((False, True) if numpy is not None else (False,)):
+            assert count_accessible_tiled(path, 5, 1, numpy_flag) == count_accessible(rows)
+            assert count_total_removable_tiled(path, 5, 1, numpy_flag) == (sum(waves), waves)
+
+    # Parsed Grid gives the same answers and is left untouched by part 2
+    grid = parse_grid("\n".join(example) + "\n")
+    assert (grid.rows, grid.cols) == (10, 10)
+    assert grid.row(1).tobytes() == b"@@@.@.@.@@"
+    assert grid.column(0) == b".@@@@..@.@"
+    assert get_accessible(grid) == expected_accessible
+    assert count_total_removable(grid) == 43
+    assert count_accessible(grid) == 13
+
+    print("All tests passed!")
+
+
+if __name__ == "__main__":
+    import sys
+    if "--test" in sys.argv[1:]:
+        test()
+
+    with open("04_input.txt") as f:
+        grid = parse_grid(f.read())
+
+    print(count_accessible(grid))
+    print(count_total_removable(grid))
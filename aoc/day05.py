@@ -0,0 +1,531 @@
+from array import array
+from bisect import bisect_left, bisect_right, insort
+
+
+def parse_input(text):
+    """Parse the input into ranges and ingredient IDs.
+
+    Text with only the ranges section (like the merged ranges written by
+    merge_ranges_external) parses with no ingredients.
+    """
+    parts = text.strip().split('\n\n')
+
+    ranges = []
+    for line in parts[0].strip().split('\n'):
+        start, end = map(int, line.split('-'))
+        ranges.append((start, end))
+
+    ingredients = []
+    if len(parts) > 1:
+        for line in parts[1].strip().split('\n'):
+            ingredients.append(int(line))
+
+    return ranges, ingredients
+
+
+def is_fresh(ingredient_id, ranges):
+    """Check if an ingredient ID falls within any fresh range."""
+    for start, end in ranges:
+        if start <= ingredient_id <= end:
+            return True
+    return False
+
+
+def count_fresh(ranges, ingredients):
+    """Count how many ingredients are fresh."""
+    return FreshIndex(ranges).count_fresh(ingredients)
+
+
+def _coalesce(sorted_ranges):
+    """Merge (start, end) ranges that arrive sorted by start, yielding each merged range."""
+    current = None
+    for start, end in sorted_ranges:
+        if current is not None and start <= current[1] + 1:
+            # Overlapping or adjacent, merge them
+            if end > current[1]:
+                current = (current[0], end)
+        else:
+            # Non-overlapping, the previous range is complete
+            if current is not None:
+                yield current
+            current = (start, end)
+    if current is not None:
+        yield current
+
+
+def merge_ranges(ranges):
+    """Sorted, merged (start, end) ranges; overlapping or adjacent ranges are joined."""
+    return list(_coalesce(sorted(ranges)))
+
+
+def count_total_fresh_ids(ranges):
+    """Count total unique IDs covered by all ranges (handling overlaps)."""
+    return sum(end - start + 1 for start, end in merge_ranges(ranges))
+
+
+def read_ranges(path):
+    """Yield the (start, end) ranges of an input file, up to the blank line."""
+    with open(path, 'rb') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                return
+            start, end = line.split(b'-')
+            yield int(start), int(end)
+
+
+_RUN_BLOCK = 1 << 14  # pairs per run file read or write (256 KiB)
+
+
+def _write_run(ranges, path, block=_RUN_BLOCK):
+    """Write sorted ranges to path as flat int64 pairs, block pairs at a time."""
+    with open(path, 'wb') as f:
+        flat = array('q')
+        for start, end in ranges:
+            flat.append(start)
+            flat.append(end)
+            if len(flat) >= 2 * block:
+                flat.tofile(f)
+                flat = array('q')
+        flat.tofile(f)
+
+
+def _read_run(path, block=_RUN_BLOCK):
+    """Yield the ranges of a run file, reading block pairs at a time."""
+    with open(path, 'rb') as f:
+        while True:
+            flat = array('q')
+            try:
+                flat.fromfile(f, 2 * block)
+            except EOFError:  # short last block; flat holds what was read
+                pass
+            if not flat:
+                return
+            yield from zip(flat[::2], flat[1::2])
+
+
+def merge_ranges_external(ranges, chunk=1 << 20, out=None, workdir=None, fan_in=64):
+    """count_total_fresh_ids() for range lists too large for memory.
+
+    ranges is an input file path (see read_ranges) or any iterable of
+    (start, end). They are sorted and coalesced chunk ranges at a time
+    into int64 run files in workdir (default: the system temp dir). Runs
+    are then k-way merged with heapq.merge, at most fan_in at a time: while
+    there are more runs than that, groups of fan_in are merged into new,
+    coalesced runs, and the last merge is coalesced in one streaming pass.
+    Memory is about one chunk plus fan_in read blocks, and at most fan_in
+    run files are open at once. If out is a path, the merged ranges are
+    written there as start-end lines, which read_ranges and parse_input
+    can load again.
+    """
+    import heapq
+    import os
+    import tempfile
+    from itertools import count, islice
+
+    if fan_in < 2:
+        raise ValueError("fan_in must be at least 2")
+    if isinstance(ranges, str):
+        ranges = read_ranges(ranges)
+    ranges = iter(ranges)
+    total = 0
+    with tempfile.TemporaryDirectory(dir=workdir) as tmp:
+        names = (os.path.join(tmp, f"run{i}") for i in count())
+        runs = []
+        while True:
+            part = list(islice(ranges, chunk))
+            if not part:
+                break
+            part.sort()
+            runs.append(next(names))
+            _write_run(_coalesce(part), runs[-1])
+            del part
+        while len(runs) > fan_in:
+            merged = []
+            for i in range(0, len(runs), fan_in):
+                group = runs[i:i + fan_in]
+                merged.append(next(names))
+                _write_run(_coalesce(heapq.merge(*map(_read_run, group))), merged[-1])
+                for path in group:
+                    os.remove(path)
+            runs = merged
+        f = open(out, 'w') if out is not None else None
+        try:
+            for start, end in _coalesce(heapq.merge(*map(_read_run, runs))):
+                total += end - start + 1
+                if f is not None:
+                    f.write(f"{start}-{end}\n")
+        finally:
+            if f is not None:
+                f.close()
+    return total
+
+
+class FreshIndex:
+    """Merged ranges as parallel start/end arrays, built once and queried many times."""
+
+    def __init__(self, ranges):
+        merged = merge_ranges(ranges)
+        self.starts = array('q', [start for start, _ in merged])
+        self.ends = array('q', [end for _, end in merged])
+
+    def __len__(self):
+        return len(self.starts)
+
+    def is_fresh(self, ingredient_id):
+        """Membership by bisect over the merged range starts."""
+        i = bisect_right(self.starts, ingredient_id) - 1
+        return i >= 0 and ingredient_id <= self.ends[i]
+
+    __contains__ = is_fresh
+
+    def count_fresh(self, ingredients):
+        """Count fresh IDs in one sort-merge walk of the IDs against the ranges."""
+        starts, ends = self.starts, self.ends
+        count = i = 0
+        n = len(starts)
+        for ingredient_id in sorted(ingredients):
+            while i < n and ends[i] < ingredient_id:
+                i += 1
+            if i == n:
+                break
+            if ingredient_id >= starts[i]:
+                count += 1
+        return count
+
+    def total_ids(self):
+        """Part 2: IDs covered by the ranges."""
+        return sum(self.ends) - sum(self.starts) + len(self.starts)
+
+    def fresh_mask(self, ids):
+        """Boolean NumPy mask of which IDs in an int64 array are fresh.
+
+        One np.searchsorted of the IDs into the range starts finds the
+        candidate range of every ID at once; the ID is fresh if it does not
+        pass that range's end.
+        """
+        import numpy as np
+
+        starts = np.frombuffer(self.starts, dtype=np.int64)
+        ends = np.frombuffer(self.ends, dtype=np.int64)
+        i = np.searchsorted(starts, ids, side='right') - 1
+        if not len(ends):
+            return np.zeros(len(ids), dtype=bool)
+        return (i >= 0) & (ids <= ends[np.maximum(i, 0)])
+
+
+def scan_id_file(index, path, chunk=1 << 23, bitmap=None):
+    """Count the fresh IDs in a binary file of little-endian int64 IDs.
+
+    The file is mmapped and masked chunk by chunk with index.fresh_mask,
+    so memory stays proportional to chunk, not to the file. If bitmap is
+    a path, the fresh mask is also written there packed 8 IDs per byte
+    (np.packbits, first ID in the high bit; the last byte is zero padded).
+    Requires NumPy.
+    """
+    import numpy as np
+    from aoc import inputs
+
+    chunk = max(8, chunk - chunk % 8)  # whole bitmap bytes per chunk
+    out = open(bitmap, 'wb') if bitmap is not None else None
+    count = 0
+    try:
+        with inputs.mapped(path) as buf:
+            if len(buf) % 8:
+                raise ValueError(f"{path}: size {len(buf)} is not a whole number of int64 IDs")
+            ids = np.frombuffer(buf, dtype='<i8')
+            try:
+                for i in range(0, len(ids), chunk):
+                    mask = index.fresh_mask(ids[i:i + chunk])
+                    count += int(np.count_nonzero(mask))
+                    if out is not None:
+                        out.write(np.packbits(mask).tobytes())
+            finally:
+                del ids  # release the buffer export before the mmap closes
+    finally:
+        if out is not None:
+            out.close()
+    return count
+
+
+class _BisectList(list):
+    """The part of sortedcontainers.SortedList that FreshRangeSet uses, on a plain list.
+
+    Inserts and deletes are O(n) memmoves instead of O(log n), which is
+    still fast for up to a few hundred thousand ranges.
+    """
+
+    def add(self, value):
+        insort(self, value)
+
+    def bisect_left(self, value):
+        return bisect_left(self, value)
+
+    def bisect_right(self, value):
+        return bisect_right(self, value)
+
+
+def _sorted_list():
+    try:
+        from sortedcontainers import SortedList
+    except ImportError:
+        return _BisectList()
+    return SortedList()
+
+
+class FreshRangeSet:
+    """Mutable set of fresh IDs kept as disjoint ranges with a running ID count.
+
+    add() and remove() have set semantics: removing a range makes all its
+    IDs spoiled, whichever added ranges covered them. Range starts live in
+    a SortedList when sortedcontainers is installed (O(log n) updates),
+    otherwise in a bisect-maintained list; each update also touches the
+    ranges it merges or splits, each of which is created only once.
+    """
+
+    def __init__(self, ranges=()):
+        self.starts = _sorted_list()
+        self.ends = {}  # start -> end
+        self.total = 0
+        for start, end in ranges:
+            self.add(start, end)
+
+    def __len__(self):
+        return len(self.starts)
+
+    def _overlapping(self, start, end, touching):
+        """Index span [i, j) of the stored ranges overlapping (or touching) [start, end]."""
+        gap = 1 if touching else 0
+        starts = self.starts
+        i = starts.bisect_right(start - 1)
+        if i and self.ends[starts[i - 1]] >= start - gap:
+            i -= 1
+        return i, starts.bisect_right(end + gap)
+
+    def _drop(self, i, j):
+        for start in self.starts[i:j]:
+            self.total -= self.ends.pop(start) - start + 1
+        del self.starts[i:j]
+
+    def _put(self, start, end):
+        self.starts.add(start)
+        self.ends[start] = end
+        self.total += end - start + 1
+
+    def add(self, start, end):
+        """Mark start..end fresh, merging with overlapping or adjacent ranges."""
+        i, j = self._overlapping(start, end, touching=True)
+        if i < j:
+            start = min(start, self.starts[i])
+            end = max(end, self.ends[self.starts[j - 1]])
+            self._drop(i, j)
+        self._put(start, end)
+
+    def remove(self, start, end):
+        """Mark start..end spoiled, trimming or splitting the ranges it overlaps."""
+        i, j = self._overlapping(start, end, touching=False)
+        if i == j:
+            return
+        first, last = self.starts[i], self.ends[self.starts[j - 1]]
+        self._drop(i, j)
+        if first < start:
+            self._put(first, start - 1)
+        if last > end:
+            self._put(end + 1, last)
+
+    def is_fresh(self, ingredient_id):
+        i = self.starts.bisect_right(ingredient_id) - 1
+        return i >= 0 and self.ends[self.starts[i]] >= ingredient_id
+
+    __contains__ = is_fresh
+
+    def total_ids(self):
+        """IDs currently fresh (part 2 of the current ranges), kept up to date."""
+        return self.total
+
+    def ranges(self):
+        return [(start, self.ends[start]) for start in self.starts]
+
+
+class FreshTally:
+    """Fed line by line: ranges are kept, ingredient IDs are only counted.
+
+    Memory is bounded by the number of ranges, however many ingredient
+    lines follow the blank separator line.
+    """
+
+    def __init__(self):
+        self.ranges = []
+        self.in_ingredients = False
+        self.fresh = 0
+        self.total_ids = None
+        self.index = None
+
+    def feed(self, line):
+        line = line.strip()
+        if not line:
+            if self.ranges and not self.in_ingredients:
+                self.in_ingredients = True
+                self.index = FreshIndex(self.ranges)
+                self.total_ids = self.index.total_ids()
+            return
+        if self.in_ingredients:
+            if self.index.is_fresh(int(line)):
+                self.fresh += 1
+        else:
+            start, end = map(int, line.split('-'))
+            self.ranges.append((start, end))
+
+    def totals(self):
+        total_ids = self.total_ids
+        if total_ids is None:
+            total_ids = count_total_fresh_ids(self.ranges)
+        return self.fresh, total_ids
+
+
+def test():
+    example = """3-5
+10-14
+16-20
+12-18
+
+1
+5
+8
+11
+17
+32"""
+    ranges, ingredients = parse_input(example)
+
+    # Test parsing
+    assert ranges == [(3, 5), (10, 14), (16, 20), (12, 18)], f"Ranges: {ranges}"
+    assert ingredients == [1, 5, 8, 11, 17, 32], f"Ingredients: {ingredients}"
+
+    # Test individual ingredients
+    assert is_fresh(1, ranges) == False, "1 should be spoiled"
+    assert is_fresh(5, ranges) == True, "5 should be fresh (in 3-5)"
+    assert is_fresh(8, ranges) == False, "8 should be spoiled"
+    assert is_fresh(11, ranges) == True, "11 should be fresh (in 10-14)"
+    assert is_fresh(17, ranges) == True, "17 should be fresh (in 16-20 and 12-18)"
+    assert is_fresh(32, ranges) == False, "32 should be spoiled"
+
+    # Test count
+    assert count_fresh(ranges, ingredients) == 3, f"Expected 3 fresh, got {count_fresh(ranges, ingredients)}"
+
+    # Part 2: Test total fresh IDs
+    # Fresh IDs: 3,4,5, 10,11,12,13,14,15,16,17,18,19,20 = 14 total
+    # Ranges: 3-5 (3 IDs), 10-14 (5 IDs), 12-18 overlaps with 10-14 and 16-20
+    # Merged: 3-5, 10-20 = 3 + 11 = 14
+    assert count_total_fresh_ids(ranges) == 14, f"Expected 14 total fresh IDs, got {count_total_fresh_ids(ranges)}"
+
+    # Streaming tally over the same lines
+    tally = FreshTally()
+    for line in example.split('\n'):
+        tally.feed(line)
+    assert tally.totals() == (3, 14)
+
+    # Merged index: bisect membership and sort-merge batch count
+    index = FreshIndex(ranges)
+    assert list(zip(index.starts, index.ends)) == [(3, 5), (10, 20)]
+    assert [i in index for i in ingredients] == [is_fresh(i, ranges) for i in ingredients]
+    assert index.count_fresh(ingredients) == 3 and index.total_ids() == 14
+    assert merge_ranges([(5, 9), (1, 3), (4, 4), (2, 2), (20, 21)]) == [(1, 9), (20, 21)]
+    assert FreshIndex([]).count_fresh([1, 2]) == 0 and 1 not in FreshIndex([])
+    import random
+    rng = random.Random(5)
+    for _ in range(20):
+        spans = [(a, a + rng.randrange(30)) for a in (rng.randrange(500) for _ in range(12))]
+        ids = [rng.randrange(-5, 560) for _ in range(300)]
+        index = FreshIndex(spans)
+        assert all((i in index) == is_fresh(i, spans) for i in ids)
+        assert index.count_fresh(ids) == sum(is_fresh(i, spans) for i in ids)
+        assert index.total_ids() == len({x for a, b in spans for x in range(a, b + 1)})
+
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+    if np is not None:
+        import os
+        import tempfile
+
+        ids = np.array([rng.randrange(-5, 120) for _ in range(1001)], dtype=np.int64)
+        big = FreshIndex([(rng.randrange(100), rng.randrange(100)) for _ in range(30)])
+        mask = big.fresh_mask(ids)
+        assert mask.tolist() == [big.is_fresh(int(i)) for i in ids]
+        assert not FreshIndex([]).fresh_mask(ids).any()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'ids.bin')
+            bits = os.path.join(tmp, 'fresh.bits')
+            ids.astype('<i8').tofile(path)
+            for size in (8, 13, 1 << 20):
+                assert scan_id_file(big, path, chunk=size, bitmap=bits) == mask.sum()
+                packed = np.fromfile(bits, dtype=np.uint8)
+                assert (np.unpackbits(packed)[:len(ids)] == mask).all()
+                assert len(packed) == (len(ids) + 7) // 8
+
+    # Out-of-core merge: many small runs give the in-memory answer
+    import os
+    import tempfile
+    many = [(a, a + rng.randrange(40)) for a in (rng.randrange(10 ** 4) for _ in range(3000))]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'input.txt')
+        merged_path = os.path.join(tmp, 'merged.txt')
+        with open(path, 'w') as f:
+            f.write(''.join(f"{a}-{b}\n" for a, b in many) + "\n7\n")
+        for chunk, fan_in in ((13, 2), (13, 5), (100, 64), (10 ** 6, 64)):
+            assert merge_ranges_external(path, chunk, out=merged_path, fan_in=fan_in) == \
+                count_total_fresh_ids(many)
+            assert list(read_ranges(merged_path)) == merge_ranges(many)
+        with open(merged_path) as f:
+            assert parse_input(f.read()) == (merge_ranges(many), [])
+        assert merge_ranges_external(ranges, 3, workdir=tmp) == 14
+        assert merge_ranges_external([]) == 0
+        assert os.listdir(tmp) == ['input.txt', 'merged.txt']
+
+    # Live range set: inserts, deletes and coverage against a plain set of IDs
+    live = FreshRangeSet(ranges)
+    assert live.ranges() == [(3, 5), (10, 20)] and live.total_ids() == 14
+    live.remove(12, 13)
+    assert live.ranges() == [(3, 5), (10, 11), (14, 20)] and live.total_ids() == 12
+    assert 11 in live and 12 not in live and 14 in live
+    live.add(6, 9)
+    assert live.ranges() == [(3, 11), (14, 20)] and live.total_ids() == 16
+    for backend in (_sorted_list, _BisectList):
+        live = FreshRangeSet()
+        live.starts = backend()
+        ids = set()
+        for _ in range(400):
+            a = rng.randrange(200)
+            b = a + rng.randrange(25)
+            if rng.random() < 0.6:
+                live.add(a, b)
+                ids.update(range(a, b + 1))
+            else:
+                live.remove(a, b)
+                ids.difference_update(range(a, b + 1))
+            assert live.total_ids() == len(ids)
+        assert all((i in live) == (i in ids) for i in range(-2, 230))
+        assert live.ranges() == merge_ranges([(i, i) for i in ids])
+
+    # Test edge cases
+    assert count_total_fresh_ids([]) == 0, "Empty ranges should return 0"
+    assert count_total_fresh_ids([(5, 5)]) == 1, "Single point range should return 1"
+    assert count_total_fresh_ids([(1, 3), (5, 7)]) == 6, "Non-overlapping ranges"
+    assert count_total_fresh_ids([(1, 5), (3, 7)]) == 7, "Overlapping ranges"
+    assert count_total_fresh_ids([(1, 5), (6, 10)]) == 10, "Adjacent ranges"
+
+    print("All tests passed!")
+
+
+if __name__ == "__main__":
+    import sys
+    if "--test" in sys.argv[1:]:
+        test()
+
+    with open("05_input.txt") as f:
+        text = f.read()
+
+    ranges, ingredients = parse_input(text)
+    print(count_fresh(ranges, ingredients))
+    print(count_total_fresh_ids(ranges))
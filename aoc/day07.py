@@ -1,29 +1,24 @@
+from aoc.grid import Grid
+
+SPLITTER = ord('^')
+
+
 def parse_grid(text):
-    """Parse the input into a grid and find the start position."""
-    lines = text.strip().split('\n')
-    grid = [list(line) for line in lines]
-
-    # Find S position
-    start_col = None
-    for col, char in enumerate(grid[0]):
-        if char == 'S':
-            start_col = col
-            break
+    """Parse the input into a Grid and find the start position."""
+    grid = Grid.from_text(text.strip())
+    return grid, find_start(grid)
 
-    return grid, start_col
+
+def find_start(grid):
+    """Column of S in the first row (None if missing)."""
+    col = grid.row(0).tobytes().find(b'S')
+    return col if col >= 0 else None
 
 
 def simulate_beams(grid):
     """Simulate tachyon beams and count splits."""
-    rows = len(grid)
-    cols = len(grid[0])
-
-    # Find start position
-    start_col = None
-    for col, char in enumerate(grid[0]):
-        if char == 'S':
-            start_col = col
-            break
+    rows, cols = grid.rows, grid.cols
+    start_col = find_start(grid)
 
     # Track active beams as (row, col) - all beams move downward
     # Start beam just below S
@@ -32,6 +27,7 @@ def simulate_beams(grid):
 
     # Process row by row
     for row in range(1, rows):
+        line = grid.row(row)
         new_beams = set()
 
         for _, col in active_beams:
@@ -40,8 +36,7 @@ def simulate_beams(grid):
                 # Beam exited left or right
                 continue
 
-            char = grid[row][col]
-            if char == '^':
+            if line[col] == SPLITTER:
                 # Splitter! Count this split and emit two beams
                 split_count += 1
                 # Left beam continues from col-1
@@ -72,15 +67,8 @@ def simulate_timelines(grid):
     Track how many timelines have a particle at each position.
     Each split creates two timelines from one.
     """
-    rows = len(grid)
-    cols = len(grid[0])
-
-    # Find start position
-    start_col = None
-    for col, char in enumerate(grid[0]):
-        if char == 'S':
-            start_col = col
-            break
+    rows, cols = grid.rows, grid.cols
+    start_col = find_start(grid)
 
     # Track number of timelines at each column position
     # Key: column, Value: number of timelines with particle at that column
@@ -88,6 +76,7 @@ def simulate_timelines(grid):
 
     # Process row by row
     for row in range(1, rows):
+        line = grid.row(row)
         new_timelines = {}
 
         for col, count in timelines.items():
@@ -96,8 +85,7 @@ def simulate_timelines(grid):
                 # Particle exited left or right - these timelines end
                 continue
 
-            char = grid[row][col]
-            if char == '^':
+            if line[col] == SPLITTER:
                 # Splitter! Each timeline splits into two
                 # Left particle goes to col-1
                 # Right particle goes to col+1
@@ -147,11 +135,17 @@ def test():
     result2 = solve_part2(example)
     assert result2 == 40, f"Expected 40 timelines, got {result2}"
 
+    grid, start_col = parse_grid(example)
+    assert (grid.rows, grid.cols, start_col) == (16, 15, 7)
+    assert grid.column(7) == b"S.^...^.......^."
+
     print("All tests passed!")
 
 
 if __name__ == "__main__":
-    test()
+    import sys
+    if "--test" in sys.argv[1:]:
+        test()
 
     with open("07_input.txt") as f:
         text = f.read()
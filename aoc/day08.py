@@ -47,21 +47,18 @@ class UnionFind:
         return sorted(sizes, reverse=True)
 
 
-def solve_part1(text, num_connections=1000):
-    """Connect num_connections closest pairs and return product of 3 largest circuits."""
-    boxes = parse_input(text)
-    n = len(boxes)
-
-    # Calculate all pairwise distances
+def sorted_edges(boxes):
+    """All pairs as (distance, i, j), closest first."""
     edges = []
-    for i, j in combinations(range(n), 2):
+    for i, j in combinations(range(len(boxes)), 2):
         d = distance(boxes[i], boxes[j])
         edges.append((d, i, j))
-
-    # Sort by distance
     edges.sort()
+    return edges
+
 
-    # Connect the closest pairs using Union-Find
+def largest_circuits_product(n, edges, num_connections=1000):
+    """Connect the num_connections closest pairs and multiply the 3 largest circuits."""
     uf = UnionFind(n)
     connections_made = 0
 
@@ -76,23 +73,10 @@ def solve_part1(text, num_connections=1000):
     return sizes[0] * sizes[1] * sizes[2]
 
 
-def solve_part2(text):
+def last_connection_product(boxes, edges):
     """Connect pairs until all in one circuit, return product of X coords of last connection."""
-    boxes = parse_input(text)
-    n = len(boxes)
-
-    # Calculate all pairwise distances
-    edges = []
-    for i, j in combinations(range(n), 2):
-        d = distance(boxes[i], boxes[j])
-        edges.append((d, i, j))
-
-    # Sort by distance
-    edges.sort()
-
-    # Connect pairs until all in one circuit
-    uf = UnionFind(n)
-    circuits_remaining = n
+    uf = UnionFind(len(boxes))
+    circuits_remaining = len(boxes)
 
     for d, i, j in edges:
         if uf.union(i, j):  # Only count if actually merged two circuits
@@ -104,6 +88,18 @@ def solve_part2(text):
     return None
 
 
+def solve_part1(text, num_connections=1000):
+    """Connect num_connections closest pairs and return product of 3 largest circuits."""
+    boxes = parse_input(text)
+    return largest_circuits_product(len(boxes), sorted_edges(boxes), num_connections)
+
+
+def solve_part2(text):
+    """Connect pairs until all in one circuit, return product of X coords of last connection."""
+    boxes = parse_input(text)
+    return last_connection_product(boxes, sorted_edges(boxes))
+
+
 def test():
     example = """162,817,812
 57,618,57
@@ -138,11 +134,18 @@ def test():
     result2 = solve_part2(example)
     assert result2 == 25272, f"Expected 25272, got {result2}"
 
+    # Both parts can share one sorted edge list
+    edges = sorted_edges(boxes)
+    assert largest_circuits_product(len(boxes), edges, 10) == 40
+    assert last_connection_product(boxes, edges) == 25272
+
     print("All tests passed!")
 
 
 if __name__ == "__main__":
-    test()
+    import sys
+    if "--test" in sys.argv[1:]:
+        test()
 
     with open("08_input.txt") as f:
         text = f.read()
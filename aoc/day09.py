@@ -25,8 +25,11 @@ def rectangle_area(p1, p2):
 
 def solve_part1(text):
     """Find largest rectangle with two red tiles as opposite corners."""
-    tiles = parse_input(text)
+    return max_rectangle_area(parse_input(text))
 
+
+def max_rectangle_area(tiles):
+    """Largest rectangle area with two of the tiles as opposite corners."""
     max_area = 0
     for t1, t2 in combinations(tiles, 2):
         area = rectangle_area(t1, t2)
@@ -99,10 +102,11 @@ def get_row_ranges(red_tiles):
 
 def solve_part2(text):
     """Find largest rectangle with red corners containing only red/green tiles."""
-    import bisect
+    return max_enclosed_area(parse_input(text))
 
-    red_tiles = parse_input(text)
 
+def max_enclosed_area(red_tiles):
+    """Largest red-cornered rectangle lying entirely inside the red/green loop."""
     # Get valid x-range for each row directly (no flood fill needed)
     valid_by_row = get_row_ranges(red_tiles)
 
@@ -226,7 +230,9 @@ def test():
 
 
 if __name__ == "__main__":
-    test()
+    import sys
+    if "--test" in sys.argv[1:]:
+        test()
 
     with open("09_input.txt") as f:
         text = f.read()
@@ -152,18 +152,27 @@ def solve_with_gaussian(n_lights, target, buttons):
     return min_presses if min_presses != float('inf') else -1
 
 
-def solve_part1(text):
-    """Find minimum total button presses for all machines."""
+def parse_input(text):
+    """Parse every machine line."""
+    return [parse_line(line) for line in text.strip().split('\n')]
+
+
+def total_presses(machines):
+    """Minimum total button presses to light every machine's indicators."""
     total = 0
-    for line in text.strip().split('\n'):
-        n_lights, target, buttons, _ = parse_line(line)
+    for i, (n_lights, target, buttons, _) in enumerate(machines):
         presses = solve_machine(n_lights, target, buttons)
         if presses == -1:
-            raise ValueError(f"No solution for line: {line}")
+            raise ValueError(f"No solution for machine {i + 1}")
         total += presses
     return total
 
 
+def solve_part1(text):
+    """Find minimum total button presses for all machines."""
+    return total_presses(parse_input(text))
+
+
 def solve_joltage(buttons, joltage):
     """Find minimum button presses to reach joltage requirements.
 
@@ -278,18 +287,47 @@ def solve_joltage(buttons, joltage):
     return min_presses if min_presses != float('inf') else -1
 
 
-def solve_part2(text):
-    """Find minimum total button presses for joltage configuration."""
+def total_joltage_presses(machines):
+    """Minimum total button presses to reach every machine's joltage."""
     total = 0
-    for line in text.strip().split('\n'):
-        _, _, buttons, joltage = parse_line(line)
+    for i, (_, _, buttons, joltage) in enumerate(machines):
         presses = solve_joltage(buttons, joltage)
         if presses == -1:
-            raise ValueError(f"No solution for line: {line}")
+            raise ValueError(f"No solution for machine {i + 1}")
         total += presses
     return total
 
 
+def solve_part2(text):
+    """Find minimum total button presses for joltage configuration."""
+    return total_joltage_presses(parse_input(text))
+
+
+class PressTotals:
+    """Running totals for both parts, one machine line at a time."""
+
+    def __init__(self):
+        self.machines = 0
+        self.presses = 0
+        self.joltage_presses = 0
+
+    def feed(self, line):
+        line = line.strip()
+        if not line:
+            return
+        self.machines += 1
+        n_lights, target, buttons, joltage = parse_line(line)
+        presses = solve_machine(n_lights, target, buttons)
+        joltage_presses = solve_joltage(buttons, joltage)
+        if presses == -1 or joltage_presses == -1:
+            raise ValueError(f"No solution for machine {self.machines}")
+        self.presses += presses
+        self.joltage_presses += joltage_presses
+
+    def totals(self):
+        return self.presses, self.joltage_presses
+
+
 def test():
     example = """[.##.] (3) (1,3) (2) (2,3) (0,2) (0,1) {3,5,4,7}
 [...#.] (0,2,3,4) (2,3) (0,4) (0,1,2) (1,2,3,4) {7,5,12,7,2}
@@ -327,11 +365,24 @@ def test():
 
     assert solve_part2(example) == 33, f"Expected 33, got {solve_part2(example)}"
 
+    # Both parts can share one parse
+    machines = parse_input(example)
+    assert len(machines) == 3
+    assert total_presses(machines) == 7
+    assert total_joltage_presses(machines) == 33
+
+    totals = PressTotals()
+    for line in example.split('\n'):
+        totals.feed(line)
+    assert totals.totals() == (7, 33)
+
     print("All tests passed!")
 
 
 if __name__ == "__main__":
-    test()
+    import sys
+    if "--test" in sys.argv[1:]:
+        test()
 
     with open("10_input.txt") as f:
         text = f.read()
@@ -123,7 +123,9 @@ hhh: out"""
 
 
 if __name__ == "__main__":
-    test()
+    import sys
+    if "--test" in sys.argv[1:]:
+        test()
 
     with open("11_input.txt") as f:
         text = f.read()
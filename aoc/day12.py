@@ -1,3 +1,4 @@
+from aoc.grid import Grid
 
 
 def parse_input(text):
@@ -10,14 +11,7 @@ def parse_input(text):
     while i < len(parts) and ':' in parts[i].split('\n')[0] and 'x' not in parts[i].split('\n')[0]:
         lines = parts[i].split('\n')
         idx = int(lines[0].rstrip(':'))
-        shape_lines = lines[1:]
-        # Convert to set of (row, col) coordinates
-        coords = set()
-        for r, line in enumerate(shape_lines):
-            for c, ch in enumerate(line):
-                if ch == '#':
-                    coords.add((r, c))
-        shapes[idx] = coords
+        shapes[idx] = Grid.from_lines(lines[1:])
         i += 1
 
     # Parse regions
@@ -33,31 +27,20 @@ def parse_input(text):
     return shapes, regions
 
 
-def get_rotations_and_flips(coords):
-    """Get all unique rotations and flips of a shape."""
-    variations = set()
+def get_rotations_and_flips(shape):
+    """Get all unique rotations and flips of a shape Grid, each trimmed to its cells.
 
-    def normalize(shape):
-        """Normalize shape to start at (0,0)."""
-        min_r = min(r for r, c in shape)
-        min_c = min(c for r, c in shape)
-        return frozenset((r - min_r, c - min_c) for r, c in shape)
-
-    def rotate_90(shape):
-        """Rotate shape 90 degrees clockwise."""
-        return {(c, -r) for r, c in shape}
-
-    def flip_h(shape):
-        """Flip shape horizontally."""
-        return {(r, -c) for r, c in shape}
-
-    current = coords
+    Trimming first makes translated copies of a variant compare equal, like
+    normalizing the cells to (0, 0) would.
+    """
+    variations = {}
+    current = shape.trimmed()
     for _ in range(4):  # 4 rotations
-        variations.add(normalize(current))
-        variations.add(normalize(flip_h(current)))
-        current = rotate_90(current)
+        for variant in (current, current.flipped()):
+            variations.setdefault(variant.key(), variant)
+        current = current.rotated()
 
-    return [set(v) for v in variations]
+    return list(variations.values())
 
 
 def can_fit_all(shapes, width, height, counts):
@@ -68,7 +51,7 @@ def can_fit_all(shapes, width, height, counts):
     - Regions that don't fit overflow by 1-3 cells (impossible)
     Area check is sufficient given the input structure.
     """
-    total_area = sum(len(shapes[i]) * counts[i] for i in range(len(counts)) if i in shapes)
+    total_area = sum(shapes[i].count('#') * counts[i] for i in range(len(counts)) if i in shapes)
     grid_area = width * height
 
     return total_area <= grid_area
@@ -77,6 +60,11 @@ def can_fit_all(shapes, width, height, counts):
 def solve_part1(text):
     """Count regions that can fit all their presents."""
     shapes, regions = parse_input(text)
+    return count_fitting(shapes, regions)
+
+
+def count_fitting(shapes, regions):
+    """Count regions whose presents all fit."""
     count = 0
     for width, height, counts in regions:
         if can_fit_all(shapes, width, height, counts):
@@ -126,11 +114,33 @@ def test():
     assert regions[1] == (12, 5, [1, 0, 1, 0, 2, 2])
 
     # Test shape 4
-    assert len(shapes[4]) == 7  # 7 cells
+    assert shapes[4].count('#') == 7  # 7 cells
+    assert shapes[4].lines() == ["###", "#..", "###"]
 
-    # Test rotations
+    # Test rotations: the C shape's mirror image is its 180 degree rotation
     variations = get_rotations_and_flips(shapes[4])
-    assert len(variations) >= 1
+    assert len(variations) == 4
+    assert all(v.count('#') == 7 for v in variations)
+    assert len(get_rotations_and_flips(shapes[5])) == 2
+    # Translated copies are the same variant: the box around a shape does not count
+    assert len(get_rotations_and_flips(Grid.from_lines(["...", ".#.", "..."]))) == 1
+    corner = get_rotations_and_flips(Grid.from_lines(["...", ".#.", ".##"]))
+    assert len(corner) == 4 and all(v.lines() in (["#.", "##"], [".#", "##"], ["##", "#."],
+                                                  ["##", ".#"]) for v in corner)
+    # ...matching the variant count of cell sets normalized to (0, 0)
+    import random
+    rng = random.Random(12)
+    for _ in range(50):
+        cells = {(r, c) for r in range(4) for c in range(4) if rng.random() < 0.4} or {(1, 2)}
+        rows = ["".join("#" if (r, c) in cells else "." for c in range(4)) for r in range(4)]
+        normalized = set()
+        current = cells
+        for _ in range(4):
+            for variant in (current, {(r, -c) for r, c in current}):
+                low_r, low_c = min(r for r, c in variant), min(c for r, c in variant)
+                normalized.add(frozenset((r - low_r, c - low_c) for r, c in variant))
+            current = {(c, -r) for r, c in current}
+        assert len(get_rotations_and_flips(Grid.from_lines(rows))) == len(normalized), rows
 
     # Test first region (should fit by area: 14 <= 16)
     assert can_fit_all(shapes, 4, 4, [0, 0, 0, 0, 2, 0]) == True
@@ -156,7 +166,9 @@ def test():
 
 
 if __name__ == "__main__":
-    test()
+    import sys
+    if "--test" in sys.argv[1:]:
+        test()
 
     with open("12_input.txt") as f:
         text = f.read()
@@ -0,0 +1,151 @@
+"""Registry of the day solvers and how each one is fed its input.
+
+Every aoc/dayNN.py has its own entry point with a slightly different
+shape (rotation list, raw text, readlines, grid rows...). The registry
+wraps each day as a parse step, an optional build step and one callable
+per part so the tooling can drive all of them the same way.
+
+Day modules are only imported when a day is actually run, so running one
+day never pays for another day's imports.
+"""
+import os
+import sys
+
+from aoc import inputs
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DAYS = [f"{d:02d}" for d in range(1, 13)]
+
+
+def load(day):
+    """Import the day's solver module (aoc.dayNN)."""
+    name = f"aoc.day{day}"
+    # __import__ rather than importlib: it goes through the C import path,
+    # which is what -X importtime (and aoc.startup) can see
+    __import__(name)
+    return sys.modules[name]
+
+
+def source_path(day):
+    return os.path.join(ROOT, 'aoc', f"day{day}.py")
+
+
+def input_path(day):
+    """Path of the puzzle input shipped for a day."""
+    return os.path.join(ROOT, f"{day}_input.txt")
+
+
+def _day05(mod, data):
+    ranges, ingredients = inputs.split_sections(data)
+    return (inputs.rows(inputs.parse_ints(ranges, b'-', width=2), 2),
+            inputs.parse_ints(ingredients, b'', width=1).tolist())
+
+
+def _lines(mod, text):
+    return text.splitlines(keepends=True)
+
+
+# day -> (parse, part1, part2); parse(mod, text) builds what the parts take.
+# Days in BUFFER_DAYS parse with aoc.inputs, so their parse also accepts
+# bytes or an mmap of the input file.
+SOLVERS = {
+    "01": (lambda mod, data: inputs.parse_signed(data),
+           lambda mod, totals: totals[0],
+           lambda mod, totals: totals[1]),
+    "02": (lambda mod, data: inputs.parse_ints(data).tolist(),
+           lambda mod, bounds: mod.sum_invalid_closed_form(bounds),
+           lambda mod, bounds: mod.sum_invalid_closed_form(bounds, at_least_twice=True)),
+    "03": (_lines,
+           lambda mod, lines: mod.solve(lines),
+           lambda mod, lines: mod.solve(lines, 12)),
+    "04": (lambda mod, text: mod.parse_grid(text),
+           lambda mod, grid: mod.count_accessible(grid),
+           lambda mod, grid: mod.count_total_removable(grid)),
+    "05": (_day05,
+           lambda mod, data: data[0].count_fresh(data[1]),
+           lambda mod, data: data[0].total_ids()),
+    "06": (lambda mod, text: mod.parse_worksheet(text),
+           lambda mod, sheet: mod.solve_part1(sheet),
+           lambda mod, sheet: mod.solve_part2(sheet)),
+    "07": (lambda mod, text: mod.parse_grid(text)[0],
+           lambda mod, grid: mod.simulate_beams(grid),
+           lambda mod, grid: mod.simulate_timelines(grid)),
+    "08": (lambda mod, data: inputs.rows(inputs.parse_ints(data, b',', width=3), 3),
+           lambda mod, data: mod.largest_circuits_product(len(data[0]), data[1]),
+           lambda mod, data: mod.last_connection_product(*data)),
+    "09": (lambda mod, data: inputs.rows(inputs.parse_ints(data, b',', width=2), 2),
+           lambda mod, tiles: mod.max_rectangle_area(tiles),
+           lambda mod, tiles: mod.max_enclosed_area(tiles)),
+    "10": (lambda mod, text: mod.parse_input(text),
+           lambda mod, machines: mod.total_presses(machines),
+           lambda mod, machines: mod.total_joltage_presses(machines)),
+    "11": (lambda mod, text: mod.parse_input(text),
+           lambda mod, graph: mod.count_paths(graph, 'you', 'out'),
+           lambda mod, graph: mod.count_paths_with_required(graph, 'svr', 'out', ['dac', 'fft'])),
+    "12": (lambda mod, text: mod.parse_input(text),
+           lambda mod, data: mod.count_fitting(*data),
+           None),
+}
+
+
+# day -> build(mod, parsed): optional step between parsing and solving that
+# precomputes structures both parts share.
+BUILDERS = {
+    "01": lambda mod, steps: mod.dial_totals(steps),
+    "05": lambda mod, data: (mod.FreshIndex(data[0]), data[1]),
+    "08": lambda mod, boxes: (boxes, mod.sorted_edges(boxes)),
+}
+
+
+BUFFER_DAYS = {"01", "02", "05", "08", "09"}
+
+
+def prepare(day, mod, text):
+    """Parse (and build, where the day has a build step) a day's input."""
+    return build(day, mod, SOLVERS[day][0](mod, text))
+
+
+def build(day, mod, parsed):
+    builder = BUILDERS.get(day)
+    return builder(mod, parsed) if builder else parsed
+
+
+def parse_file(day, mod, path=None):
+    """Parse a day's input file, mmapped for the days that parse bytes."""
+    path = path or input_path(day)
+    if day in BUFFER_DAYS:
+        with inputs.mapped(path) as buf:
+            return SOLVERS[day][0](mod, buf)
+    with open(path) as f:
+        return SOLVERS[day][0](mod, f.read())
+
+
+def parts(day):
+    """Part numbers that exist for a day."""
+    return [i for i, fn in enumerate(SOLVERS[day][1:], 1) if fn is not None]
+
+
+class DaySpecError(ValueError):
+    """A day argument that does not name a (suitable) day."""
+
+
+def parse_days(specs):
+    """Expand day specs like '01..12', '3,5' or '7' into sorted day keys."""
+    days = set()
+    for spec in specs:
+        for item in spec.split(','):
+            item = item.strip()
+            if not item:
+                continue
+            try:
+                if '..' in item:
+                    lo, hi = item.split('..')
+                    days.update(f"{d:02d}" for d in range(int(lo), int(hi) + 1))
+                else:
+                    days.add(f"{int(item):02d}")
+            except ValueError:
+                raise DaySpecError(f"Invalid day spec: {item!r}") from None
+    unknown = sorted(days - set(DAYS))
+    if unknown:
+        raise DaySpecError(f"Unknown day(s): {', '.join(unknown)}")
+    return sorted(days)
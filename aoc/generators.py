@@ -0,0 +1,246 @@
+"""Seeded synthetic input generators for every day.
+
+generate(day, scale, seed) returns puzzle text in the same format as
+NN_input.txt. Scale 1 is roughly the size of the shipped input and the
+amount of data grows linearly with scale (grid days grow both sides by
+sqrt(scale) so the cell count is linear). The same (day, scale, seed)
+always produces the same text.
+"""
+import math
+import random
+import string
+
+
+def _count(base, scale):
+    return max(1, round(base * scale))
+
+
+def gen_01(rng, scale):
+    lines = []
+    for _ in range(_count(4800, scale)):
+        lines.append(f"{rng.choice('LR')}{rng.randint(1, 999)}")
+    return '\n'.join(lines) + '\n'
+
+
+def gen_02(rng, scale):
+    ranges = []
+    for _ in range(_count(34, scale)):
+        digits = rng.randint(2, 10)
+        start = rng.randint(10 ** (digits - 1), 10 ** digits - 1)
+        width = int(10 ** rng.uniform(1, 5))
+        ranges.append(f"{start}-{start + width}")
+    return ','.join(ranges) + '\n'
+
+
+def gen_03(rng, scale):
+    lines = []
+    for _ in range(_count(200, scale)):
+        lines.append(''.join(rng.choice('123456789') for _ in range(100)))
+    return '\n'.join(lines) + '\n'
+
+
+def gen_04(rng, scale):
+    side = max(3, round(135 * math.sqrt(scale)))
+    lines = []
+    for _ in range(side):
+        lines.append(''.join('@' if rng.random() < 0.65 else '.' for _ in range(side)))
+    return '\n'.join(lines) + '\n'
+
+
+def gen_05(rng, scale):
+    top = 10 ** 15
+    ranges = []
+    for _ in range(_count(190, scale)):
+        start = rng.randint(1, top)
+        ranges.append(f"{start}-{start + rng.randint(0, top // 1000)}")
+    ingredients = [str(rng.randint(1, top)) for _ in range(_count(1000, scale))]
+    return '\n'.join(ranges) + '\n\n' + '\n'.join(ingredients) + '\n'
+
+
+def gen_06(rng, scale):
+    rows = [[] for _ in range(5)]
+    for _ in range(_count(1000, scale)):
+        numbers = [str(rng.randint(1, 9999)) for _ in range(4)]
+        width = max(len(n) for n in numbers)
+        align = str.ljust if rng.random() < 0.5 else str.rjust
+        for row, n in zip(rows, numbers):
+            row.append(align(n, width))
+        rows[4].append(rng.choice('+*').ljust(width))
+    return '\n'.join(' '.join(row) for row in rows) + '\n'
+
+
+def gen_07(rng, scale):
+    cols = max(3, round(141 * math.sqrt(scale))) | 1
+    rows = max(2, round(142 * math.sqrt(scale)))
+    lines = ['.' * (cols // 2) + 'S' + '.' * (cols // 2)]
+    for r in range(1, rows):
+        if r % 2:
+            lines.append('.' * cols)
+        else:
+            lines.append(''.join('^' if rng.random() < 0.35 else '.' for _ in range(cols)))
+    return '\n'.join(lines) + '\n'
+
+
+def gen_08(rng, scale):
+    boxes = _count(1000, scale)
+    if boxes < 1000:
+        # Part 1 always makes 1000 connections: with a few hundred random
+        # boxes that joins them all into one circuit and there is no top 3
+        raise ValueError(f"day 08 needs scale >= 1 (scale {scale} gives {boxes} boxes)")
+    lines = []
+    for _ in range(boxes):
+        lines.append(','.join(str(rng.randint(0, 99999)) for _ in range(3)))
+    return '\n'.join(lines) + '\n'
+
+
+def gen_09(rng, scale):
+    """Closed axis-aligned polygon: a right chain going down, a left chain going up."""
+    steps = _count(124, scale)
+    span = 100000 * max(1, round(scale))
+    mid = span // 2
+    ys = sorted(rng.sample(range(span), steps + 1))
+    lefts = rng.sample(range(1, mid - 1), steps)
+    rights = rng.sample(range(mid + 1, span), steps)
+    tiles = []
+    for i in range(steps):
+        tiles.append((rights[i], ys[i]))
+        tiles.append((rights[i], ys[i + 1]))
+    for i in reversed(range(steps)):
+        tiles.append((lefts[i], ys[i + 1]))
+        tiles.append((lefts[i], ys[i]))
+    return '\n'.join(f"{x},{y}" for x, y in tiles) + '\n'
+
+
+def gen_10(rng, scale):
+    lines = []
+    for _ in range(_count(200, scale)):
+        n_lights = rng.randint(4, 10)
+        buttons = []
+        for _ in range(rng.randint(n_lights - 2, n_lights + 1)):
+            buttons.append(sorted(rng.sample(range(n_lights), rng.randint(1, n_lights))))
+        # Targets are built from actual press counts so both parts are solvable
+        joltage = [0] * n_lights
+        for button in buttons:
+            count = rng.randint(0, 8)
+            for i in button:
+                joltage[i] += count
+        for i in range(n_lights):
+            if not joltage[i]:
+                buttons.append([i])
+                joltage[i] = 1
+        target = [0] * n_lights
+        for button in buttons:
+            if rng.random() < 0.5:
+                for i in button:
+                    target[i] ^= 1
+        indicator = ''.join('#' if t else '.' for t in target)
+        schematics = ' '.join('(' + ','.join(map(str, b)) + ')' for b in buttons)
+        lines.append(f"[{indicator}] {schematics} {{{','.join(map(str, joltage))}}}")
+    return '\n'.join(lines) + '\n'
+
+
+def gen_11(rng, scale):
+    """Layered DAG, so path depth (and the solver's recursion) stays shallow."""
+    n_layers = 16
+    width = max(2, _count(600, scale) // n_layers)
+    # Three letters like the real input, more once those run out
+    name_len = max(3, math.ceil(math.log(4 * n_layers * width, 26)))
+    names = set()
+    while len(names) < n_layers * width:
+        name = ''.join(rng.choice(string.ascii_lowercase) for _ in range(name_len))
+        if name not in ('you', 'out', 'svr', 'dac', 'fft'):
+            names.add(name)
+    names = sorted(names)
+    rng.shuffle(names)
+    layers = [names[i * width:(i + 1) * width] for i in range(n_layers)]
+    layers[0][0] = 'svr'
+    layers[1][0] = 'you'
+    layers[n_layers // 3][0] = 'fft'
+    layers[2 * n_layers // 3][0] = 'dac'
+    lines = []
+    for i, layer in enumerate(layers):
+        for node in layer:
+            if i + 1 < n_layers:
+                outputs = rng.sample(layers[i + 1], min(len(layers[i + 1]), rng.randint(1, 3)))
+                # Make sure the named nodes (placed first in their layer) are well connected
+                if layers[i + 1][0] not in outputs and rng.random() < 0.2:
+                    outputs.append(layers[i + 1][0])
+                if rng.random() < 0.3:
+                    outputs.append('out')
+            else:
+                outputs = ['out']
+            lines.append(f"{node}: {' '.join(outputs)}")
+    rng.shuffle(lines)
+    return '\n'.join(lines) + '\n'
+
+
+def gen_12(rng, scale):
+    blocks = []
+    areas = []
+    for idx in range(6):
+        cells = [[rng.random() < 0.7 for _ in range(3)] for _ in range(3)]
+        cells[1][1] = True
+        areas.append(sum(map(sum, cells)))
+        rows = '\n'.join(''.join('#' if c else '.' for c in row) for row in cells)
+        blocks.append(f"{idx}:\n{rows}")
+    regions = []
+    for _ in range(_count(1000, scale)):
+        w, h = rng.randint(35, 50), rng.randint(35, 50)
+        counts = [rng.randint(15, 50) for _ in range(6)]
+        need = sum(a * c for a, c in zip(areas, counts))
+        # Roughly half the regions overflow, the rest have plenty of room
+        if need > w * h or rng.random() < 0.5:
+            while sum(a * c for a, c in zip(areas, counts)) <= w * h:
+                counts[rng.randrange(6)] += 1
+        regions.append(f"{w}x{h}: {' '.join(map(str, counts))}")
+    return '\n\n'.join(blocks) + '\n\n' + '\n'.join(regions) + '\n'
+
+
+GENERATORS = {
+    "01": gen_01, "02": gen_02, "03": gen_03, "04": gen_04,
+    "05": gen_05, "06": gen_06, "07": gen_07, "08": gen_08,
+    "09": gen_09, "10": gen_10, "11": gen_11, "12": gen_12,
+}
+
+# Default size ladder per day, picked so the whole suite stays in the
+# minutes range on the current solvers. Pass explicit scales to go further.
+LADDERS = {
+    "01": (1, 10, 100, 1000),
+    "02": (0.1, 1, 10),
+    "03": (1, 10, 100),
+    "04": (1, 4, 16),
+    "05": (1, 4, 16),
+    "06": (1, 10, 100),
+    "07": (1, 10, 100),
+    "08": (1, 2, 4),
+    "09": (1, 2, 4),
+    "10": (1, 4, 16),
+    "11": (1, 10, 100),
+    "12": (1, 10, 100),
+}
+
+
+def generate(day, scale=1, seed=0):
+    """Generate input text for a day at the given scale."""
+    rng = random.Random(f"{day}:{float(scale)}:{seed}")
+    return GENERATORS[day](rng, scale)
+
+
+def test():
+    from aoc import days
+
+    # Every generator gives input its own day parses and solves at scale 1
+    for day in days.DAYS:
+        text = generate(day, 1, seed=1)
+        assert text == generate(day, 1, seed=1) != generate(day, 1, seed=2), day
+        mod = days.load(day)
+        data = days.prepare(day, mod, text)
+        for part in days.parts(day):
+            assert days.SOLVERS[day][part](mod, data) is not None, (day, part)
+    assert len(generate("01", 10)) > 9 * len(generate("01", 1))
+    try:
+        generate("08", 0.2)
+        assert False, "day 08 below scale 1 should be rejected"
+    except ValueError:
+        pass
+    print("All tests passed!")
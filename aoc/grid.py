@@ -0,0 +1,151 @@
+"""Compact character grid shared by the grid days (04, 07, 12).
+
+A Grid keeps every cell as one byte in a single bytearray, row after row
+with a fixed stride, surrounded by `pad` cells of filler on every side.
+Neighbour lookups are plain index arithmetic (i + offset) and never need
+a bounds check, and a 10k x 10k grid is ~100 MB instead of the several
+GB a list of lists of 1-char strings costs.
+
+Cells are addressed either as (row, col) or by flat index into data;
+index() and position() convert between the two. array() and shifted()
+expose the same memory as NumPy views for vectorized work (NumPy is
+only imported when they are called).
+"""
+
+
+def _byte(value):
+    return value if isinstance(value, int) else ord(value)
+
+
+class Grid:
+    def __init__(self, rows, cols, fill='.', pad=1):
+        self.rows = rows
+        self.cols = cols
+        self.pad = pad
+        self.fill = _byte(fill)
+        self.stride = cols + 2 * pad
+        self.height = rows + 2 * pad
+        self.data = bytearray([self.fill]) * (self.stride * self.height)
+
+    @classmethod
+    def from_lines(cls, lines, fill='.', pad=1):
+        """Build from equal-or-shorter lines; short lines are padded with fill."""
+        lines = [line.rstrip('\r\n') if isinstance(line, str) else line for line in lines]
+        grid = cls(len(lines), max((len(line) for line in lines), default=0), fill, pad)
+        for r, line in enumerate(lines):
+            if isinstance(line, str):
+                line = line.encode()
+            start = grid.index(r, 0)
+            grid.data[start:start + len(line)] = line
+        return grid
+
+    @classmethod
+    def from_text(cls, text, fill='.', pad=1):
+        return cls.from_lines(text.strip('\n').split('\n'), fill, pad)
+
+    def copy(self):
+        grid = Grid.__new__(Grid)
+        grid.__dict__.update(self.__dict__)
+        grid.data = bytearray(self.data)
+        return grid
+
+    def index(self, r, c):
+        """Flat index of (r, c) in data."""
+        return (r + self.pad) * self.stride + c + self.pad
+
+    def position(self, i):
+        """(r, c) of flat index i."""
+        r, c = divmod(i, self.stride)
+        return r - self.pad, c - self.pad
+
+    def __getitem__(self, rc):
+        return chr(self.data[self.index(*rc)])
+
+    def __setitem__(self, rc, value):
+        self.data[self.index(*rc)] = _byte(value)
+
+    def neighbor_offsets(self, diagonal=True):
+        """Flat index offsets of the 8 (or 4) neighbours of a cell."""
+        s = self.stride
+        if diagonal:
+            return [-s - 1, -s, -s + 1, -1, 1, s - 1, s, s + 1]
+        return [-s, -1, 1, s]
+
+    def row(self, r):
+        """Row r without padding, as a zero-copy memoryview of bytes."""
+        start = self.index(r, 0)
+        return memoryview(self.data)[start:start + self.cols]
+
+    def column(self, c):
+        """Column c without padding, as bytes."""
+        start = self.index(0, c)
+        return bytes(self.data[start:start + self.rows * self.stride:self.stride])
+
+    def indices(self, value):
+        """Flat indices of all cells equal to value, in row-major order."""
+        return list(self.iter_indices(value))
+
+    def iter_indices(self, value):
+        """indices() one at a time, without building the list."""
+        data, b = self.data, bytes([_byte(value)])
+        inside = self._inside if self.fill == b[0] else None
+        i = data.find(b)
+        while i != -1:
+            if inside is None or inside(i):
+                yield i
+            i = data.find(b, i + 1)
+
+    def _inside(self, i):
+        r, c = self.position(i)
+        return 0 <= r < self.rows and 0 <= c < self.cols
+
+    def count(self, value):
+        """Number of cells equal to value (padding excluded)."""
+        b = bytes([_byte(value)])
+        return sum(self.row(r).tobytes().count(b) for r in range(self.rows))
+
+    def lines(self):
+        return [self.row(r).tobytes().decode() for r in range(self.rows)]
+
+    def rotated(self):
+        """Copy rotated 90 degrees clockwise."""
+        lines = self.lines()
+        return Grid.from_lines([''.join(lines[self.rows - 1 - r][c] for r in range(self.rows))
+                                for c in range(self.cols)], chr(self.fill), self.pad)
+
+    def flipped(self):
+        """Copy mirrored left to right."""
+        return Grid.from_lines([line[::-1] for line in self.lines()], chr(self.fill), self.pad)
+
+    def trimmed(self):
+        """Copy cropped to the bounding box of the cells that are not fill."""
+        fill = chr(self.fill)
+        lines = self.lines()
+        used = [r for r, line in enumerate(lines) if line.strip(fill)]
+        if not used:
+            return Grid(0, 0, fill, self.pad)
+        lines = lines[used[0]:used[-1] + 1]
+        left = min(len(line) - len(line.lstrip(fill)) for line in lines if line.strip(fill))
+        right = max(len(line.rstrip(fill)) for line in lines)
+        return Grid.from_lines([line[left:right] for line in lines], fill, self.pad)
+
+    def key(self):
+        """Hashable content key (shape and cells, padding excluded)."""
+        return self.rows, self.cols, b''.join(self.row(r).tobytes() for r in range(self.rows))
+
+    def array(self):
+        """The whole padded grid as a (height, stride) uint8 NumPy view."""
+        import numpy as np
+        return np.frombuffer(self.data, dtype=np.uint8).reshape(self.height, self.stride)
+
+    def shifted(self, dr=0, dc=0, array=None):
+        """NumPy view of the interior moved by (dr, dc): cell (r, c) holds (r+dr, c+dc).
+
+        array is a (height, stride) array derived from this grid, such as a
+        mask of array() == value (default: array() itself). Valid for
+        |dr|, |dc| <= pad, which is what neighbour sums need.
+        """
+        if array is None:
+            array = self.array()
+        p = self.pad
+        return array[p + dr:p + dr + self.rows, p + dc:p + dc + self.cols]
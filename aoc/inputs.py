@@ -0,0 +1,345 @@
+"""Memory-mapped input files and integer parsing straight from bytes.
+
+The numeric days (01, 02, 05, 08, 09) only need the integers in their
+input. Instead of read() -> str.split() -> int() per token, the file is
+mmapped and the integers are pulled out of the raw buffer:
+
+- with NumPy, the buffer is viewed as uint8 without copying and the
+  digits are combined into int64 values with a few vectorized passes;
+- without NumPy, the buffer is copied once, every non-digit byte is
+  translated to a space in one C-level pass and the bytes tokens go
+  straight to int() (no str decode), collected into array('q').
+
+NumPy is optional and imported lazily: by default it is only used for
+buffers of 1 MiB and up, below that importing it costs more than it
+saves. Pass numpy=True/False to force either path.
+
+Integers are unsigned: '-' is a separator here because day 02 and day 05
+use it between range bounds. parse_signed() is the day 01 variant where
+a direction letter gives the sign.
+
+Parsing is strict about which bytes may appear: digits, whitespace and
+the separators the caller names. Anything else (a stray letter, a minus
+sign on a day whose numbers are comma separated) raises ValueError
+rather than being skipped, and with width= every line must hold that
+many integers, so a malformed input fails instead of giving a wrong
+answer.
+"""
+import mmap
+from array import array
+from contextlib import contextmanager
+
+np = None  # set by _use_numpy() on first use
+
+_NUMPY_MIN_BYTES = 1 << 20
+_DIGITS = b'0123456789'
+_WHITESPACE = b' \t\r\n'
+_TO_SPACES = bytes(b if b in _DIGITS else 32 for b in range(256))
+
+
+@contextmanager
+def mapped(path):
+    """Yield a read-only mmap of the file (empty bytes for an empty file).
+
+    If the body raises, the finished frames in its traceback are cleared
+    before the map is closed: their memoryviews and NumPy arrays over the
+    buffer would otherwise make close() raise BufferError in place of the
+    real error (a parse error in day 05's sections, say).
+    """
+    with open(path, 'rb') as f:
+        try:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # cannot mmap an empty file
+            buf = None
+        if buf is None:
+            # Outside the except: errors in the body must not chain onto it
+            yield b''
+            return
+        try:
+            yield buf
+        except BaseException as e:
+            import traceback
+
+            traceback.clear_frames(e.__traceback__)
+            raise
+        finally:
+            buf.close()
+
+
+def _as_bytes(data):
+    return data.encode() if isinstance(data, str) else data
+
+
+def _use_numpy(numpy, data):
+    global np
+    if numpy is None:
+        if len(data) < _NUMPY_MIN_BYTES:
+            return False
+        try:
+            import numpy as np
+        except ImportError:
+            return False
+        return True
+    if numpy:
+        import numpy as np
+    return numpy
+
+
+def _reject(data, index):
+    raise ValueError(f"unexpected byte {bytes(data[index:index + 1])!r} at offset {index}")
+
+
+def _check(data, allowed):
+    """Raise ValueError at the first byte of data not in allowed."""
+    stray = data.translate(None, allowed)
+    if stray:
+        _reject(data, data.find(stray[:1]))
+
+
+def _np_check(raw, allowed):
+    ok = np.zeros(256, dtype=bool)
+    ok[np.frombuffer(allowed, dtype=np.uint8)] = True
+    valid = ok[raw]
+    if not valid.all():
+        _reject(raw, int(valid.argmin()))
+
+
+def parse_ints(data, separators=b'-,', numpy=None, width=None):
+    """All unsigned integers in data (str, bytes, mmap...), in order.
+
+    Integers may be split by whitespace and the bytes in separators; any
+    other byte raises ValueError. With width, every non-blank line must
+    hold exactly width integers joined by separators (ValueError naming
+    the first line that does not). Returns an int64 NumPy array when the
+    NumPy path is used, otherwise array('q').
+    """
+    data = _as_bytes(data)
+    allowed = _DIGITS + _WHITESPACE + separators
+    if _use_numpy(numpy, data):
+        raw = np.frombuffer(data, dtype=np.uint8)
+        _np_check(raw, allowed)
+        values, starts = _np_parse(raw)
+        if width is not None and not _np_rows_ok(raw, starts, width, separators):
+            del raw, starts  # see mapped()
+            _reject_rows(data, width, separators)
+        return values
+    data = bytes(data)
+    _check(data, allowed)
+    values = array('q', map(int, data.translate(_TO_SPACES).split()))
+    if width is not None and not _rows_ok(data, len(values), width, separators):
+        _reject_rows(data, width, separators)
+    return values
+
+
+def _rows_ok(data, count, width, separators):
+    """Whether count integers in data form lines of width separated fields."""
+    # Digits -> 0, separators -> ',', spaces/tabs/CR dropped; collapse the
+    # digit runs and every line must then be exactly 0,0,...,0 (or blank)
+    table = bytes(48 if b in _DIGITS else 44 if b in separators else b for b in range(256))
+    shape = data.translate(table, b' \t\r')
+    while b'00' in shape:
+        shape = shape.replace(b'00', b'0')
+    row = b','.join([b'0'] * width)
+    if shape.replace(row, b'').translate(None, b'\n'):
+        return False
+    # Whitespace inside a line merged two numbers into one run above
+    return shape.count(row) * width == count
+
+
+def _np_rows_ok(raw, starts, width, separators):
+    """_rows_ok() for the NumPy path, from the line of every number."""
+    line = np.searchsorted(np.flatnonzero(raw == 10), starts)
+    numbers = np.bincount(line)
+    if not ((numbers == 0) | (numbers == width)).all():
+        return False
+    is_sep = np.zeros(256, dtype=bool)
+    is_sep[np.frombuffer(separators, dtype=np.uint8)] = True
+    seps = np.flatnonzero(is_sep[raw])
+    if seps.size != np.count_nonzero(numbers) * (width - 1):
+        return False
+    if not seps.size:
+        return True
+    # Every separator sits in its own gap between two numbers of one line
+    after = np.searchsorted(starts, seps)
+    if after[0] == 0 or after[-1] == starts.size:
+        return False
+    return bool((line[after - 1] == line[after]).all() and (np.diff(after) > 0).all())
+
+
+def _reject_rows(data, width, separators):
+    """Raise ValueError for the first line that is not width separated integers."""
+    table = bytes(44 if b in separators else b for b in range(256))
+    for number, line in enumerate(bytes(data).split(b'\n'), 1):
+        if not line.strip():
+            continue
+        fields = line.translate(table).split(b',') if separators else [line]
+        if len(fields) != width or not all(f.strip().isdigit() for f in fields):
+            expected = ("one integer" if width == 1 else
+                        f"{width} integers separated by {separators.decode()!r}")
+            raise ValueError(f"line {number}: {line.strip().decode()!r} is not {expected}")
+    raise ValueError(f"input is not lines of {width} integers")
+
+
+def parse_signed(data, negative=b'L', positive=b'R', numpy=None):
+    """Integers signed by the byte in front of them (day 01: L68 -> -68, R48 -> 48).
+
+    Besides digits and whitespace only the two sign bytes are accepted,
+    every sign byte must be directly followed by digits and every number
+    must have one in front of it.
+    """
+    data = _as_bytes(data)
+    allowed = _DIGITS + _WHITESPACE + negative + positive
+    if _use_numpy(numpy, data):
+        raw = np.frombuffer(data, dtype=np.uint8)
+        _np_check(raw, allowed)
+        values, starts = _np_parse(raw)
+        before = raw[np.maximum(starts - 1, 0)]
+        signed = (starts > 0) & ((before == negative[0]) | (before == positive[0]))
+        signs = np.flatnonzero((raw == negative[0]) | (raw == positive[0]))
+        unused = np.ones(signs.size, dtype=bool)
+        unused[np.searchsorted(signs, starts[signed] - 1)] = False
+        bad = np.concatenate((starts[~signed], signs[unused]))
+        if bad.size:
+            _reject(raw, int(bad.min()))
+        negate = before == negative[0]
+        values[negate] *= -1
+        return values
+    table = bytes(45 if bytes([b]) == negative else (b if b in _DIGITS else 32)
+                  for b in range(256))
+    data = bytes(data)
+    _check(data, allowed)
+    # Every sign byte starts a number and every number starts with one:
+    # in the shape below (digits -> 0, signs -> L, space padded at both
+    # ends) that rules out 'L ', 'LL' and ' 0'
+    shape = data.translate(bytes(48 if b in _DIGITS else 76 if b in negative + positive else 32
+                                 for b in range(256)))
+    shape = b' ' + shape + b' '
+    bad = [at - 1 for at in (shape.find(b'L '), shape.find(b'LL'), shape.find(b' 0') + 1)
+           if at > 0]
+    if bad:
+        _reject(data, min(bad))
+    # The sign byte may directly follow the previous number's digits
+    return array('q', map(int, data.translate(table).replace(b'-', b' -').split()))
+
+
+_POW10 = None
+
+
+def _np_parse(raw):
+    """Vectorized digit-run parser. Returns (int64 values, run start offsets)."""
+    global _POW10
+    if _POW10 is None:
+        _POW10 = 10 ** np.arange(19, dtype=np.int64)
+    is_digit = (raw >= 48) & (raw <= 57)
+    edges = np.diff(is_digit.astype(np.int8), prepend=np.int8(0), append=np.int8(0))
+    starts = np.flatnonzero(edges == 1)
+    lengths = np.flatnonzero(edges == -1) - starts
+    if not starts.size:
+        return np.zeros(0, dtype=np.int64), starts
+    if lengths.max() > 18:
+        raise OverflowError("integer field longer than 18 digits")
+    digits = raw[is_digit].astype(np.int64) - 48
+    # Offset of each token inside the compacted digit array
+    offsets = np.zeros(lengths.size, dtype=np.int64)
+    np.cumsum(lengths[:-1], out=offsets[1:])
+    power = np.repeat(offsets + lengths, lengths) - np.arange(digits.size) - 1
+    digits *= _POW10[power]
+    return np.add.reduceat(digits, offsets), starts
+
+
+def split_sections(data):
+    """Split bytes or an mmap on the first blank line into memoryview halves."""
+    data = _as_bytes(data)
+    at = data.find(b'\n\n')
+    view = memoryview(data)
+    if at < 0:
+        return view, view[len(view):]
+    return view[:at], view[at + 2:]
+
+
+def rows(values, width):
+    """Group a flat int array into tuples of width (x,y,z triples, start-end pairs).
+
+    Raises ValueError if the values do not fill a whole number of tuples.
+    """
+    if len(values) % width:
+        raise ValueError(f"{len(values)} integers do not split into groups of {width}")
+    flat = values.tolist()
+    return list(zip(*[iter(flat)] * width))
+
+
+def read_ints(path, separators=b'-,', numpy=None):
+    """parse_ints() over an mmapped file."""
+    with mapped(path) as buf:
+        return parse_ints(buf, separators, numpy)
+
+
+def test():
+    paths = [False]
+    try:
+        import numpy  # noqa: F401
+        paths.append(True)
+    except ImportError:
+        pass
+    for numpy in paths:
+        assert parse_ints(b"11-22,95-115\n", numpy=numpy).tolist() == [11, 22, 95, 115]
+        assert parse_signed(b"L68\nR48\r\nL5", numpy=numpy).tolist() == [-68, 48, -5]
+        for data, separators in ((b"3-5\ngarbage\n", b'-'), (b"-3,4\n", b','), (b"1;2", b'-,')):
+            try:
+                parse_ints(data, separators, numpy=numpy)
+                assert False, f"{data!r} should be rejected"
+            except ValueError:
+                pass
+        assert parse_signed(b"L68R5", numpy=numpy).tolist() == [-68, 5]
+        for data, offset in ((b"L68\nX3\n", 4), (b"L 68\nR5", 0), (b"L\nR5", 0),
+                             (b"LR5", 0), (b"R5\n68\n", 3), (b"R5R", 2)):
+            try:
+                parse_signed(data, numpy=numpy)
+                assert False, f"{data!r} should be rejected"
+            except ValueError as e:
+                assert f"offset {offset}" in str(e), e
+    # Line structure: a line with the wrong number of fields is not
+    # regrouped into tuples with its neighbours
+    for numpy in paths:
+        assert parse_ints(b"1,2,3\n\n4,5,6\r\n", b',', numpy, width=3).tolist() == \
+            [1, 2, 3, 4, 5, 6]
+        for data, separators, width, line in ((b"3-5\n10\n12\n", b'-', 2, 2),
+                                              (b"1,2\n3,4,5,6\n", b',', 3, 1),
+                                              (b"1,2\n3 4\n", b',', 2, 2),
+                                              (b"7\n8 9\n", b'', 1, 2)):
+            try:
+                parse_ints(data, separators, numpy, width)
+                assert False, f"{data!r} should be rejected"
+            except ValueError as e:
+                assert str(e).startswith(f"line {line}:"), e
+
+    # A parse error inside mapped() surfaces as itself, not as a BufferError
+    # from closing a map that the failing frames still have views into
+    import os
+    import tempfile
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'input.txt')
+        with open(path, 'wb') as f:
+            f.write(b"garbage\n3-5\n\n1\n")
+        for numpy in paths:
+            try:
+                with mapped(path) as buf:
+                    parse_ints(split_sections(buf)[0], b'-', numpy=numpy)
+                assert False, "garbage should be rejected"
+            except ValueError as e:
+                assert "offset 0" in str(e), e
+        # ...and an error on an empty file is not chained onto the mmap failure
+        open(path, 'wb').close()
+        try:
+            with mapped(path) as buf:
+                assert buf == b''
+                parse_ints(b"x")
+        except ValueError as e:
+            assert e.__context__ is None, e.__context__
+    assert rows(array('q', [1, 2, 3, 4]), 2) == [(1, 2), (3, 4)]
+    try:
+        rows(array('q', [1, 2, 3]), 2)
+        assert False, "a partial row should be rejected"
+    except ValueError:
+        pass
+    print("All tests passed!")
@@ -0,0 +1,161 @@
+"""Opt-in per-phase instrumentation for a single day.
+
+A day run is split into phases: parse, build (only for days that have a
+build step) and one solve phase per part. Each phase is timed, and with
+memory tracing on, tracemalloc also records its peak memory and its net
+blocks: live memory blocks after the phase minus before it. That is not
+an allocation count (tracemalloc cannot give one) and it is negative when
+a phase frees more blocks than it keeps. The whole run can be wrapped in
+cProfile or in a stack collector that writes the collapsed-stack format
+flamegraph.pl / speedscope read.
+"""
+import os
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+
+from aoc import days
+
+
+def phases(day, mod, text=None, path=None, part_numbers=None):
+    """Yield (name, callable) pairs; each callable takes the previous phase's result.
+
+    The input is either text or a file path; files are read (or mmapped)
+    inside the parse phase.
+    """
+    if path:
+        yield 'parse', lambda _: days.parse_file(day, mod, path)
+    else:
+        yield 'parse', lambda _: days.SOLVERS[day][0](mod, text)
+    build = days.BUILDERS.get(day)
+    if build:
+        yield 'build', lambda parsed: build(mod, parsed)
+    for part in part_numbers or days.parts(day):
+        solver = days.SOLVERS[day][part]
+        # Solve phases all take the prepared data, not each other's answers
+        yield f'part{part}', lambda data, solver=solver: (data, solver(mod, data))
+
+
+def run_phases(day, text=None, path=None, part_numbers=None, memory=False, hook=None):
+    """Run a day phase by phase and return a list of per-phase records.
+
+    hook, if given, is called as hook(name, fn, arg) to run each phase,
+    which lets cProfile or a StackCollector wrap it. Wall times are
+    inflated while memory tracing (or a hook) is on.
+    """
+    mod = days.load(day)
+    records = []
+    data = None
+    if memory:
+        tracemalloc.start()
+    try:
+        for name, fn in phases(day, mod, text, path, part_numbers):
+            if memory:
+                tracemalloc.reset_peak()
+                before_size, _ = tracemalloc.get_traced_memory()
+                before_blocks = _traced_blocks()
+            wall, cpu = time.perf_counter(), time.process_time()
+            result = hook(name, fn, data) if hook else fn(data)
+            record = {
+                'phase': name,
+                'wall': time.perf_counter() - wall,
+                'cpu': time.process_time() - cpu,
+            }
+            if name.startswith('part'):
+                data, record['answer'] = result
+            else:
+                data = result
+            if memory:
+                size, peak = tracemalloc.get_traced_memory()
+                record['peak_bytes'] = peak - before_size
+                record['retained_bytes'] = size - before_size
+                record['net_blocks'] = _traced_blocks() - before_blocks
+            records.append(record)
+    finally:
+        if memory:
+            tracemalloc.stop()
+    return records
+
+
+def _traced_blocks():
+    snapshot = tracemalloc.take_snapshot()
+    return sum(stat.count for stat in snapshot.statistics('filename'))
+
+
+def format_phases(day, records):
+    """Render phase records as a table."""
+    memory = 'peak_bytes' in records[0] if records else False
+    header = ['Phase', 'Wall (s)', 'CPU (s)']
+    if memory:
+        header += ['Peak (KiB)', 'Retained (KiB)', 'Net blocks']
+    header.append('Answer')
+    rows = []
+    for r in records:
+        row = [r['phase'], f"{r['wall']:.4f}", f"{r['cpu']:.4f}"]
+        if memory:
+            row += [f"{r['peak_bytes'] / 1024:.1f}", f"{r['retained_bytes'] / 1024:.1f}",
+                    str(r['net_blocks'])]
+        row.append(str(r.get('answer', '')))
+        rows.append(row)
+    widths = [max(len(row[i]) for row in rows + [header]) for i in range(len(header))]
+
+    def fmt(row):
+        return '  '.join(cell.ljust(w) if i == 0 else cell.rjust(w)
+                         for i, (cell, w) in enumerate(zip(row, widths)))
+
+    lines = [f"Day {day}", fmt(header), '  '.join('-' * w for w in widths)]
+    lines.extend(fmt(row) for row in rows)
+    return '\n'.join(lines)
+
+
+class StackCollector:
+    """Deterministic profiler that aggregates self time per call stack.
+
+    Uses sys.setprofile, so every Python and C call is seen; overhead is
+    high but the output is exact. write() emits collapsed stacks, one
+    "frame;frame;frame microseconds" line per distinct stack.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self.totals = defaultdict(int)
+        self.stack = []
+
+    def run(self, name, fn, arg):
+        """Call fn(arg) with collection on, under a root;name stack prefix."""
+        self.stack = [[self.root, 0, 0], [name, time.perf_counter_ns(), 0]]
+        sys.setprofile(self._profile)
+        try:
+            return fn(arg)
+        finally:
+            sys.setprofile(None)
+            while len(self.stack) > 1:
+                self._pop(time.perf_counter_ns())
+
+    def _profile(self, frame, event, arg):
+        now = time.perf_counter_ns()
+        if event == 'call':
+            code = frame.f_code
+            label = f"{os.path.basename(code.co_filename)}:{code.co_name}"
+            self.stack.append([label, now, 0])
+        elif event == 'c_call':
+            label = getattr(arg, '__qualname__', None) or getattr(arg, '__name__', repr(arg))
+            self.stack.append([label, now, 0])
+        elif event in ('return', 'c_return', 'c_exception'):
+            # The phase frame itself is never popped here
+            if len(self.stack) > 2:
+                self._pop(now)
+
+    def _pop(self, now):
+        label, start, child = self.stack.pop()
+        elapsed = now - start
+        key = ';'.join(entry[0] for entry in self.stack) + ';' + label
+        self.totals[key] += elapsed - child
+        self.stack[-1][2] += elapsed
+
+    def write(self, path):
+        with open(path, 'w') as f:
+            for key, ns in sorted(self.totals.items()):
+                if ns >= 1000:
+                    f.write(f"{key} {ns // 1000}\n")
@@ -0,0 +1,120 @@
+"""Run several days (and parts) across a process pool and time them.
+
+The process pool is only imported when more than one task is scheduled,
+so running a single day stays cheap to start.
+"""
+import os
+import time
+
+from aoc import days
+
+
+def run_day(day, part_numbers=None, self_test=False):
+    """Run the requested parts of one day in this process.
+
+    The input is read and parsed once and shared by the parts. Returns a
+    list of result dicts with the answer plus wall-clock and CPU seconds.
+    Reading, parsing and the build step (days.BUILDERS) are shared work
+    both parts need; they are timed too and charged to the first part
+    run. With self_test the day's example assertions run first (untimed).
+    """
+    mod = days.load(day)
+    if self_test:
+        mod.test()
+    solvers = days.SOLVERS[day][1:]
+    wall, cpu = time.perf_counter(), time.process_time()
+    data = days.build(day, mod, days.parse_file(day, mod))
+    shared_wall, shared_cpu = time.perf_counter() - wall, time.process_time() - cpu
+
+    results = []
+    for part in part_numbers or days.parts(day):
+        solver = solvers[part - 1]
+        wall, cpu = time.perf_counter() - shared_wall, time.process_time() - shared_cpu
+        shared_wall = shared_cpu = 0.0
+        answer = solver(mod, data)
+        results.append({
+            'day': day,
+            'part': part,
+            'answer': answer,
+            'wall': time.perf_counter() - wall,
+            'cpu': time.process_time() - cpu,
+        })
+    return results
+
+
+def run(day_list, part_numbers=None, jobs=None, split_parts=False, cache=None,
+        self_test=False):
+    """Run days in parallel and return (results, elapsed wall seconds).
+
+    By default a task is one whole day. With split_parts every part gets
+    its own task, which helps when one part dominates (day 10 part 2).
+    With a ResultCache, parts whose answer is cached are not run at all
+    and only this process touches the cache.
+    """
+    start = time.perf_counter()
+    results = []
+    keys = {}
+    tasks = []
+    for day in day_list:
+        wanted = [p for p in days.parts(day) if not part_numbers or p in part_numbers]
+        if cache is not None:
+            from aoc.cache import input_digest, solver_version
+            keys[day] = solver_version(day), input_digest(days.input_path(day))
+            wanted = [p for p in wanted if not _cached(cache, day, p, keys[day], results)]
+        if split_parts:
+            tasks.extend((day, [p]) for p in wanted)
+        elif wanted:
+            tasks.append((day, wanted))
+
+    fresh = []
+    if jobs == 1 or len(tasks) <= 1:
+        for day, wanted in tasks:
+            fresh.extend(run_day(day, wanted, self_test))
+    else:
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+
+        with ProcessPoolExecutor(max_workers=jobs or os.cpu_count()) as pool:
+            futures = [pool.submit(run_day, day, wanted, self_test) for day, wanted in tasks]
+            for future in as_completed(futures):
+                fresh.extend(future.result())
+    if cache is not None:
+        for r in fresh:
+            cache.put(r['day'], r['part'], *keys[r['day']], r['answer'], r['wall'])
+    results.extend(fresh)
+    elapsed = time.perf_counter() - start
+
+    results.sort(key=lambda r: (r['day'], r['part']))
+    return results, elapsed
+
+
+def _cached(cache, day, part, key, results):
+    hit = cache.get(day, part, *key)
+    if hit is None:
+        return False
+    answer, seconds = hit
+    results.append({'day': day, 'part': part, 'answer': answer,
+                     'wall': 0.0, 'cpu': 0.0, 'cached': seconds})
+    return True
+
+
+def format_table(results, elapsed):
+    """Render results as a per-day/per-part timing table."""
+    rows = [(r['day'], str(r['part']), str(r['answer']),
+             f"{r['wall']:.3f}", f"{r['cpu']:.3f}",
+             f"hit ({r['cached']:.3f}s saved)" if 'cached' in r else '')
+            for r in results]
+    header = ('Day', 'Part', 'Answer', 'Wall (s)', 'CPU (s)', 'Cache')
+    widths = [max(len(row[i]) for row in rows + [header]) for i in range(len(header))]
+
+    def fmt(row):
+        return '  '.join(cell.rjust(w) if 2 <= i <= 4 else cell.ljust(w)
+                         for i, (cell, w) in enumerate(zip(row, widths))).rstrip()
+
+    lines = [fmt(header), '  '.join('-' * w for w in widths)]
+    lines.extend(fmt(row) for row in rows)
+    total_wall = sum(r['wall'] for r in results)
+    total_cpu = sum(r['cpu'] for r in results)
+    lines.append('')
+    lines.append(f"Sum of parts: {total_wall:.3f}s wall, {total_cpu:.3f}s CPU")
+    lines.append(f"Elapsed:      {elapsed:.3f}s")
+    return '\n'.join(lines)
@@ -0,0 +1,77 @@
+"""Startup budget for python -m aoc run DAY.
+
+Runs the command in a subprocess under -X importtime and looks at every
+module imported once aoc itself starts loading (the interpreter and
+runpy's own imports are not ours to trim). A day run must stay under the
+import-time budget and must not import the heavy or unrelated modules in
+FORBIDDEN, nor any other day's solver, unless the day's own code imports
+them. Note itertools is already loaded by runpy before aoc starts, so a
+day importing it costs nothing and never shows up here.
+"""
+import ast
+import subprocess
+import sys
+import time
+
+from aoc import days
+
+FORBIDDEN = {'re', 'fractions', 'itertools', 'argparse', 'json', 'numpy',
+             'concurrent', 'multiprocessing', 'sqlite3'}
+
+
+def measure(day):
+    """Return (wall seconds, [(module, self_us, cumulative_us)]) for `run DAY`."""
+    cmd = [sys.executable, '-X', 'importtime', '-m', 'aoc', 'run', day, '-j', '1']
+    start = time.perf_counter()
+    proc = subprocess.run(cmd, cwd=days.ROOT, capture_output=True, text=True)
+    wall = time.perf_counter() - start
+    if proc.returncode:
+        raise RuntimeError(f"{' '.join(cmd)} failed:\n{proc.stderr}")
+
+    modules = []
+    seen_aoc = False
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        if not seen_aoc:
+            seen_aoc = name.strip() == 'aoc'
+            if not seen_aoc:
+                continue
+        modules.append((name.strip(), int(self_us), int(cumulative_us)))
+    return wall, modules
+
+
+def own_imports(day):
+    """Top-level module names the day's source imports anywhere."""
+    with open(days.source_path(day)) as f:
+        tree = ast.parse(f.read())
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name.split('.')[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            names.add(node.module.split('.')[0])
+    return names
+
+
+def check(day, budget_ms):
+    """Measure a day's startup and return (report lines, list of violations)."""
+    wall, modules = measure(day)
+    total_ms = sum(self_us for _, self_us, _ in modules) / 1000
+    allowed = own_imports(day)
+    problems = []
+    for name, _, _ in modules:
+        top = name.split('.')[0]
+        if top in FORBIDDEN and top not in allowed:
+            problems.append(f"imports {name}")
+        if name[:7] == 'aoc.day' and name[7:].isdigit() and name != f'aoc.day{day}':
+            problems.append(f"imports another day's solver {name}")
+    if total_ms > budget_ms:
+        problems.append(f"imports take {total_ms:.1f} ms, budget {budget_ms} ms")
+
+    report = [f"Day {day}: {len(modules)} modules imported by aoc in {total_ms:.1f} ms "
+              f"(process wall {wall * 1000:.0f} ms)"]
+    for name, self_us, cumulative_us in sorted(modules, key=lambda m: -m[2])[:8]:
+        report.append(f"  {cumulative_us / 1000:7.2f} ms  {name}")
+    return report, problems
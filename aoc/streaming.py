@@ -0,0 +1,68 @@
+"""Streaming mode: feed a day's input line by line in constant memory.
+
+The one-pass days each have an accumulator class with feed(line) and
+totals() -> (part1, part2). Lines come from a file, a gzip file or stdin
+and are never held all at once; running totals are reported every
+`every` lines and/or every `interval` seconds.
+"""
+import sys
+import time
+
+from aoc import days
+
+# day -> accumulator class name in aoc.dayNN
+ACCUMULATORS = {
+    "01": "DialCounter",
+    "03": "JoltageTotals",
+    "05": "FreshTally",
+    "10": "PressTotals",
+}
+
+
+def open_lines(path):
+    """Text line iterator for a path; '-' is stdin, *.gz is decompressed on the fly."""
+    if path == '-':
+        return sys.stdin
+    if path.endswith('.gz'):
+        import gzip
+        return gzip.open(path, 'rt')
+    return open(path)
+
+
+def accumulator(day):
+    if day not in ACCUMULATORS:
+        raise days.DaySpecError(f"Day {day} has no streaming mode "
+                                f"(available: {', '.join(sorted(ACCUMULATORS))})")
+    return getattr(days.load(day), ACCUMULATORS[day])()
+
+
+def run(day, lines, every=None, interval=None, report=None):
+    """Feed lines to the day's accumulator; return (line count, totals).
+
+    report(count, totals) is called every `every` lines and whenever
+    `interval` seconds have passed since the last report, and once more
+    with the totals so far if a line fails.
+    """
+    acc = accumulator(day)
+    next_time = time.monotonic() + interval if interval else None
+    count = 0
+    for line in lines:
+        try:
+            acc.feed(line)
+        except Exception:
+            # Keep what was solved so far visible before the error surfaces
+            if report is not None:
+                report(count, acc.totals())
+            raise
+        count += 1
+        if report is None:
+            continue
+        if every and count % every == 0:
+            report(count, acc.totals())
+            if next_time:
+                next_time = time.monotonic() + interval
+        # Checking the clock on every line would dominate cheap days
+        elif next_time and count % 1024 == 0 and time.monotonic() >= next_time:
+            report(count, acc.totals())
+            next_time = time.monotonic() + interval
+    return count, acc.totals()